@@ -9,19 +9,24 @@ import to:
 
 from __future__ import annotations
 
-import csv
-import glob
+import functools
 import html
 import json
+import math
+import mmap
 import os
 import re
-import traceback
-import unicodedata
+import stat
+import sys
 from datetime import datetime
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .crash_file import check_for_crash_file
 
+# csv, traceback, unicodedata, concurrent.futures and multiprocessing are imported
+# where used: every pytest worker imports this module via the plugin,
+# but only crash and report-patching paths need them.
+
 # Generic env vars
 ENV_CRASHED_TESTS_LOG = "PYTEST_ABORT_CRASHED_TESTS_LOG"
 
@@ -30,35 +35,137 @@ try:
 except ImportError:  # pragma: no cover
     fcntl = None  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore
+
+
+def _json_loads(data):
+    """json.loads, using orjson when available (accepts str or bytes)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than stdlib (NaN, >64-bit ints); let json decide.
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Compact, non-ASCII-preserving json.dumps, using orjson when available."""
+    if orjson is not None:
+        try:
+            out = orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # orjson writes NaN/Infinity as null. Without any null in the output
+            # nothing was lost; otherwise let json decide (it keeps NaN/Infinity).
+            if b"null" not in out:
+                return out.decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+class _ControlCharTable(dict):
+    """str.translate table mapping category "C" code points to a space.
+
+    ASCII is prefilled; any other code point is classified with unicodedata on
+    its first lookup and cached, so translate stays in C for code points it has
+    already seen instead of falling back to a per-character Python loop.
+    """
+
+    def __missing__(self, cp: int):
+        import unicodedata  # pylint: disable=import-outside-toplevel
+
+        repl = " " if unicodedata.category(chr(cp))[0] == "C" else cp
+        self[cp] = repl
+        return repl
+
+
+def _ascii_control_table(keep: str = "") -> _ControlCharTable:
+    """Control-char table with ASCII prefilled; chars in `keep` are left as-is."""
+    table = _ControlCharTable({i: " " for i in range(0x20)})
+    table[0x7F] = " "
+    table.update((i, i) for i in range(0x20, 0x7F))
+    for ch in keep:
+        table[ord(ch)] = ord(ch)
+    return table
+
+
+_JSON_CTRL_TABLE = _ascii_control_table("\n\r\t")
+_LONGREPR_CTRL_TABLE = _ascii_control_table("\n")
+_HTML_BLOB_CTRL_TABLE = _ascii_control_table()
+_HTML_BLOB_CTRL_TABLE.update({ord("\n"): "<br/>", ord("\r"): "<br/>", ord("\t"): "  "})
+
 
 def sanitize_for_json(text: Optional[str]) -> Optional[str]:
     """Remove control characters that break JSON parsing, preserving \\n/\\r/\\t."""
     if not text:
         return text
-    return "".join(
-        ch if unicodedata.category(ch)[0] != "C" or ch in "\n\r\t" else " "
-        for ch in text
-    )
+    return text.translate(_JSON_CTRL_TABLE)
 
 
 def _sanitize_str_for_html_jsonblob(text: str) -> str:
     """Sanitize strings for pytest-html jsonblob so merger/UI won't break."""
     if not text:
         return text
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = text.replace("\n", "<br/>")
-    text = text.replace("\t", "  ")
-    return "".join(ch if unicodedata.category(ch)[0] != "C" else " " for ch in text)
+    # "\r\n" must collapse into a single <br/>; lone "\r"/"\n" go via the table.
+    return text.replace("\r\n", "\n").translate(_HTML_BLOB_CTRL_TABLE)
+
+
+# Strings shorter than this are memoized across deep-walks; longer ones (logs)
+# are rarely repeated and would only bloat the cache.
+_SANITIZE_CACHE_MAX_LEN = 256
+
 
+@functools.lru_cache(maxsize=65536)
+def _sanitize_short_str_for_html_jsonblob(text: str) -> str:
+    return _sanitize_str_for_html_jsonblob(text)
 
-def _sanitize_obj_for_html_jsonblob(obj):
-    if isinstance(obj, dict):
-        return {k: _sanitize_obj_for_html_jsonblob(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_sanitize_obj_for_html_jsonblob(v) for v in obj]
+
+def _sanitize_any_str_for_html_jsonblob(text: str) -> str:
+    # jsonblobs repeat the same short strings (results, table cell HTML, nodeid
+    # fragments) for every test and across reports, so sanitize each distinct
+    # value once per process (bounded LRU).
+    if len(text) >= _SANITIZE_CACHE_MAX_LEN:
+        return _sanitize_str_for_html_jsonblob(text)
+    return _sanitize_short_str_for_html_jsonblob(text)
+
+
+def _sanitize_obj_for_html_jsonblob(obj) -> Tuple[Any, bool]:
+    """Sanitize every string value of a parsed jsonblob, in place.
+
+    Returns (obj, changed); obj is only a new object for a bare top-level
+    string. Walks with an explicit stack and rewrites only the values that
+    change, so callers don't need to deep-compare against a copy.
+    """
     if isinstance(obj, str):
-        return _sanitize_str_for_html_jsonblob(obj)
-    return obj
+        new = _sanitize_any_str_for_html_jsonblob(obj)
+        return new, new != obj
+    changed = False
+    stack = [obj] if isinstance(obj, (dict, list)) else []
+    while stack:
+        cur = stack.pop()
+        for k, v in cur.items() if isinstance(cur, dict) else enumerate(cur):
+            if isinstance(v, str):
+                new = _sanitize_any_str_for_html_jsonblob(v)
+                if new is not v and new != v:
+                    cur[k] = new
+                    changed = True
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
+    return obj, changed
+
+
+# Raw control chars -> JSON escape sequences.
+_CTRL_ESCAPE_TABLE = {i: f"\\u{i:04x}" for i in range(0x20)}
+_CTRL_ESCAPE_TABLE.update({ord("\n"): "\\n", ord("\r"): "\\r", ord("\t"): "\\t"})
 
 
 def _escape_control_chars_in_json_strings(json_text: str) -> str:
@@ -68,172 +175,304 @@ def _escape_control_chars_in_json_strings(json_text: str) -> str:
     (e.g. JSONDecodeError: Invalid control character). We only escape when we're
     inside a JSON string (between quotes), so whitespace between tokens is left
     untouched.
+
+    Rather than walking every character, split on quotes and track string state
+    per segment; each in-string segment is escaped with one str.translate.
     """
-    out = []
+    parts = json_text.split('"')
     in_string = False
-    escaped = False
+    for i, part in enumerate(parts):
+        if in_string:
+            if not part.isprintable():
+                parts[i] = part.translate(_CTRL_ESCAPE_TABLE)
+            # A quote preceded by an odd run of backslashes is escaped: the
+            # string literal continues into the next segment.
+            if part.endswith("\\") and (len(part) - len(part.rstrip("\\"))) % 2:
+                continue
+        in_string = not in_string
+    return '"'.join(parts)
 
-    for ch in json_text:
-        if not in_string:
-            out.append(ch)
-            if ch == '"':
-                in_string = True
-            continue
 
-        # Inside a JSON string literal.
-        if escaped:
-            out.append(ch)
-            escaped = False
-            continue
+# The deep-walk can only change something if the blob has raw whitespace
+# controls or JSON escapes of control chars (json.dumps writes other control
+# chars as \u00XX).
+_SANITIZE_ESCAPE_RE = re.compile(r"\\(?:[nrtbf]|u00[01])")
 
-        if ch == "\\":
-            out.append(ch)
-            escaped = True
-            continue
 
-        if ch == '"':
-            out.append(ch)
-            in_string = False
-            continue
+def _jsonblob_may_need_sanitize(json_text: str) -> bool:
+    """Cheap pre-scan: False means sanitizing json_text cannot change it.
 
-        code = ord(ch)
-        if code < 0x20:
-            if ch == "\n":
-                out.append("\\n")
-            elif ch == "\r":
-                out.append("\\r")
-            elif ch == "\t":
-                out.append("\\t")
-            else:
-                out.append(f"\\u{code:04x}")
-        else:
-            out.append(ch)
+    Single-char `in` checks are memchr-fast; the escapes all start with a
+    backslash, and one prefixed regex pass beats a substring scan per escape.
+    """
+    return (
+        "\n" in json_text
+        or "\r" in json_text
+        or "\t" in json_text
+        or ("\\" in json_text and _SANITIZE_ESCAPE_RE.search(json_text) is not None)
+    )
 
-    return "".join(out)
 
+def _encode_jsonblob_attr(obj: Any) -> str:
+    """Serialize obj for a data-jsonblob attribute (HTML-escaped, quote-safe).
 
-def sanitize_html_file_jsonblob(html_path: str) -> bool:
-    """Parse + sanitize a single pytest-html report's data-jsonblob in place.
+    html.escape's chained str.replace passes are memchr-fast; a single
+    str.translate with multi-char replacements is an order of magnitude slower
+    on multi-MB blobs, so keep html.escape.
+    """
+    return html.escape(_json_dumps(obj), quote=True)
 
-    Returns True if modified.
+
+# The only entities html.escape(..., quote=True) produces; "&amp;" must go last.
+_JSONBLOB_ENTITIES = (("&quot;", '"'), ("&#x27;", "'"), ("&lt;", "<"), ("&gt;", ">"), ("&amp;", "&"))
+
+
+def _unescape_jsonblob_attr(raw_attr: str) -> str:
+    """html.unescape for a data-jsonblob attribute value.
+
+    Blobs written by pytest-html (or _encode_jsonblob_attr) only contain the
+    html.escape entities, and there is one per JSON quote. Replacing those with
+    str.replace avoids html.unescape's per-entity regex callback; anything
+    else (numeric/named entities) still goes through html.unescape.
+    """
+    n_amp = raw_attr.count("&")
+    if not n_amp:
+        return raw_attr
+    if n_amp != sum(raw_attr.count(entity) for entity, _ in _JSONBLOB_ENTITIES):
+        return html.unescape(raw_attr)
+    for entity, ch in _JSONBLOB_ENTITIES:
+        raw_attr = raw_attr.replace(entity, ch)
+    return raw_attr
+
+
+def _find_jsonblob_attr(html_content) -> Optional[Tuple[int, int]]:
+    """Return (start, end) offsets of the data-jsonblob attribute value, if any.
+
+    html_content is a str or a bytes-like buffer (e.g. an mmap). Plain find
+    scans instead of a regex: the blob can be tens of MB.
+    """
+    if isinstance(html_content, str):
+        anchor_needle, quotes, prefix = 'id="data-container"', ('"', "'"), "data-jsonblob="
+    else:
+        anchor_needle, quotes, prefix = b'id="data-container"', (b'"', b"'"), b"data-jsonblob="
+    # pytest-html puts the blob on <div id="data-container" ...>; start there so
+    # the needle can't be matched in body text before it (e.g. synthesized
+    # abort rows), but fall back to the whole document.
+    anchor = html_content.find(anchor_needle)
+    for pos in ((anchor, 0) if anchor > 0 else (0,)):
+        # Scan for the attribute name once and read the delimiter after it:
+        # most pytest-html reports double-quote it, but accept single quotes.
+        i = html_content.find(prefix, pos)
+        while i >= 0:
+            start = i + len(prefix) + 1
+            quote = html_content[start - 1 : start]
+            if quote in quotes:
+                end = html_content.find(quote, start)
+                if end >= 0:
+                    return start, end
+            i = html_content.find(prefix, start)
+    return None
+
+
+def _parse_jsonblob_text(json_text: str) -> Tuple[Any, bool]:
+    """Decode an (HTML-unescaped) jsonblob, repairing it if needed.
+
+    Returns (data, repaired). Raises json.JSONDecodeError/ValueError if the
+    blob can't be parsed even after repair.
     """
     try:
-        with open(html_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-    except OSError:
-        return False
+        return _json_loads(json_text), False
+    except (json.JSONDecodeError, ValueError):
+        # Repair common corruption: literal control chars inside JSON strings.
+        return _json_loads(_escape_control_chars_in_json_strings(json_text)), True
 
-    # Fast skip for files without a jsonblob.
-    if 'data-jsonblob="' not in html_content and "data-jsonblob='" not in html_content:
-        return False
 
-    # Most pytest-html reports use a double-quoted attribute.
-    m = re.search(r'data-jsonblob="([^"]*)"', html_content, flags=re.DOTALL)
-    attr_quote = '"'
-    if not m:
-        # Be tolerant: handle single-quoted variants.
-        m = re.search(r"data-jsonblob='([^']*)'", html_content, flags=re.DOTALL)
-        attr_quote = "'"
-    if not m:
-        return False
+def _sanitized_jsonblob_attr(html_buf, html_path: str) -> Optional[Tuple[int, int, str]]:
+    """Return (start, end, new_attr) if html_buf's data-jsonblob needs rewriting.
 
-    raw_attr = m.group(1)
-    json_text = html.unescape(raw_attr)
+    html_buf is the raw report bytes (or an mmap); only the attribute is decoded.
+    """
+    span = _find_jsonblob_attr(html_buf)
+    if span is None:
+        return None
 
-    # If this jsonblob doesn't contain anything we might transform, avoid the
-    # expensive json.loads + deep-walk. (We still repair malformed blobs below.)
-    maybe_needs_sanitize = (
-        "\n" in json_text
-        or "\r" in json_text
-        or "\t" in json_text
-        or "\\n" in json_text
-        or "\\r" in json_text
-        or "\\t" in json_text
-        or "\\u000" in json_text
-        or "\\u001" in json_text
-    )
+    raw_attr = html_buf[span[0] : span[1]].decode("utf-8")
+    json_text = _unescape_jsonblob_attr(raw_attr)
 
+    # If this jsonblob doesn't contain anything we might transform, avoid the
+    # expensive json.loads + deep-walk + re-dump + re-escape entirely.
+    if not _jsonblob_may_need_sanitize(json_text):
+        # No likely transformations needed and blob looked syntactically fine.
+        return None
     try:
-        data = json.loads(json_text) if maybe_needs_sanitize else None
+        data, repaired = _parse_jsonblob_text(json_text)
     except (json.JSONDecodeError, ValueError) as exc:
-        # Repair common corruption: literal control chars inside JSON strings.
-        fixed_text = _escape_control_chars_in_json_strings(json_text)
-        try:
-            data = json.loads(fixed_text)
-        except (json.JSONDecodeError, ValueError) as exc2:
-            raise ValueError(
-                f"Could not parse data-jsonblob in {html_path}: {exc2}"
-            ) from exc2
+        raise ValueError(f"Could not parse data-jsonblob in {html_path}: {exc}") from exc
+
+    sanitized, changed = _sanitize_obj_for_html_jsonblob(data)
+    # Decide on the walk's result rather than re-serialized text: the dumper's
+    # separators may differ from the ones pytest-html used.
+    if not changed and not repaired:
+        return None
+    # _encode_jsonblob_attr escapes both " and ', so the original quote type
+    # used in the attribute is preserved safely.
+    new_attr = _encode_jsonblob_attr(sanitized)
+    if new_attr == raw_attr:
+        return None
+    return span[0], span[1], new_attr
 
-    if data is None:
-        # No likely transformations needed and blob looked syntactically fine.
-        return False
 
-    sanitized = _sanitize_obj_for_html_jsonblob(data)
-    dumped = json.dumps(sanitized, ensure_ascii=False)
-    new_attr = html.escape(dumped, quote=True)
-    if new_attr == raw_attr:
-        return False
+def sanitize_html_file_jsonblob(html_path: str) -> bool:
+    """Parse + sanitize a single pytest-html report's data-jsonblob in place.
 
-    # Preserve the original quote type used in the attribute.
-    if attr_quote == "'":
-        # html.escape(..., quote=True) escapes both " and ', so safe.
-        pass
+    The report is memory-mapped, so only the jsonblob attribute is decoded;
+    a rewrite streams prefix + new blob + suffix into a temp file that then
+    replaces the report (keeping the report's permission bits).
 
-    new_html = html_content[: m.start(1)] + new_attr + html_content[m.end(1) :]
+    Returns True if modified.
+    """
+    tmp = f"{html_path}.tmp.{os.getpid()}"
     try:
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(new_html)
+        with open(html_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not st.st_size:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                edit = _sanitized_jsonblob_attr(mm, html_path)
+                if edit is None:
+                    return False
+                start, end, new_attr = edit
+                with open(tmp, "wb") as out, memoryview(mm) as view:
+                    out.write(view[:start])
+                    out.write(new_attr.encode("utf-8"))
+                    out.write(view[end:])
+        # The temp file is a new inode created with the umask's mode.
+        os.chmod(tmp, stat.S_IMODE(st.st_mode))
+        os.replace(tmp, html_path)
     except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
         return False
     return True
 
 
-def sanitize_all_html_jsonblobs(log_dir: str) -> Tuple[int, int, int]:
+# Below this many files, process-pool startup costs more than it saves.
+_PARALLEL_SANITIZE_MIN_FILES = 4
+
+
+def _sanitize_html_file_jsonblob_safe(html_path: str) -> Optional[bool]:
+    """sanitize_html_file_jsonblob, returning None instead of raising."""
+    try:
+        return sanitize_html_file_jsonblob(html_path)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def _list_html_logs(log_dir: str) -> List[str]:
+    """Sorted paths of the *_log.html files in log_dir (hidden files skipped, like glob)."""
+    try:
+        with os.scandir(log_dir) as it:
+            return sorted(
+                entry.path
+                for entry in it
+                if entry.name.endswith("_log.html")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            )
+    except OSError:
+        return []
+
+
+def sanitize_all_html_jsonblobs(log_dir: str, *, max_workers: Optional[int] = 1) -> Tuple[int, int, int]:
     """Sanitize all *_log.html files in log_dir.
 
+    Runs in-process by default. Files are independent, so callers may opt in
+    to a process pool for larger batches (max_workers > 1, or None for the CPU
+    count). The pool always uses the "fork" start method, so workers never
+    re-import the caller's __main__; where fork is unavailable or unsafe
+    (Windows, macOS) the files are sanitized in-process. Opt in only while the
+    calling process has no other threads running.
+
     Returns (modified, total, failed).
     """
-    html_files = glob.glob(os.path.join(log_dir, "*_log.html"))
-    modified = 0
-    failed = 0
-    for p in sorted(html_files):
+    html_files = _list_html_logs(log_dir)
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(html_files))
+
+    results = None
+    if (
+        max_workers > 1
+        and len(html_files) >= _PARALLEL_SANITIZE_MIN_FILES
+        and sys.platform != "darwin"
+        and hasattr(os, "fork")
+    ):
+        import concurrent.futures  # pylint: disable=import-outside-toplevel
+        import multiprocessing  # pylint: disable=import-outside-toplevel
+
         try:
-            if sanitize_html_file_jsonblob(p):
-                modified += 1
-        except Exception:  # pylint: disable=broad-exception-caught
-            failed += 1
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+            ) as ex:
+                results = list(
+                    ex.map(_sanitize_html_file_jsonblob_safe, html_files, chunksize=4)
+                )
+        except (OSError, concurrent.futures.BrokenExecutor):
+            # Best-effort: fall back to sequential if workers can't be used.
+            results = None
+    if results is None:
+        results = [_sanitize_html_file_jsonblob_safe(p) for p in html_files]
+        # Shared across the batch's reports; release it once they're done.
+        _sanitize_short_str_for_html_jsonblob.cache_clear()
+
+    modified = sum(1 for r in results if r)
+    failed = sum(1 for r in results if r is None)
     return modified, len(html_files), failed
 
 
-def append_crash_to_jsonl(crash_log_file: str, crash_info: Dict[str, Any], *, source: str) -> None:
-    """Append a crash record to a JSONL file (one JSON object per line)."""
+def append_crash_to_jsonl(
+    crash_log_file: str,
+    crash_info: Dict[str, Any],
+    *,
+    source: str,
+    now: Optional[datetime] = None,
+) -> None:
+    """Append a crash record to a JSONL file (one JSON object per line).
+
+    ``now`` lets batch callers stamp every record with one clock read.
+    """
     payload = dict(crash_info)
     payload["source"] = source
-    payload["logged_at"] = datetime.now().isoformat()
+    payload["logged_at"] = (now or datetime.now()).isoformat()
 
     os.makedirs(os.path.dirname(crash_log_file) or ".", exist_ok=True)
-    line = json.dumps(payload, ensure_ascii=False) + "\n"
-    with open(crash_log_file, "a", encoding="utf-8") as f:
-        # Best-effort cross-process safety (Linux): lock the file while appending.
+    line = _json_dumps(payload) + "\n"
+    data = line.encode("utf-8")
+    # O_APPEND only guarantees that each write(2) starts at the current end of
+    # file (on local filesystems; not over NFS). It does not keep a record
+    # whole across short writes, so cooperating writers also hold an flock
+    # (best-effort, Linux) while the whole record goes out.
+    fd = os.open(crash_log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
         if fcntl is not None:
             try:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                fcntl.flock(fd, fcntl.LOCK_EX)
             except OSError:
                 pass
-        try:
-            f.write(line)
-            f.flush()
-        finally:
-            if fcntl is not None:
-                try:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                except OSError:
-                    pass
-
-
-def append_abort_to_json(json_file: str, testfile: str, abort_info: Dict[str, Any]) -> None:
-    """Append abort info to pytest-json-report formatted JSON."""
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            if not written:
+                raise OSError(f"short write appending to {crash_log_file}")
+            view = view[written:]
+    finally:
+        # Closing the fd also releases the lock.
+        os.close(fd)
+
+
+def _abort_test_json(testfile: str, abort_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the pytest-json-report test entry for one abort record."""
     test_identifier = abort_info["test_name"]
     test_class = abort_info.get("test_class", "UnknownClass")
 
@@ -256,10 +495,7 @@ def append_abort_to_json(json_file: str, testfile: str, abort_info: Dict[str, An
         test_nodeid = f"{testfile}.py::{test_identifier}"
 
     abort_reason_clean = abort_info.get("reason", "Unknown abort reason") or ""
-    abort_reason_clean = "".join(
-        ch if unicodedata.category(ch)[0] != "C" or ch == "\n" else " "
-        for ch in abort_reason_clean
-    )
+    abort_reason_clean = abort_reason_clean.translate(_LONGREPR_CTRL_TABLE)
 
     abort_longrepr = (
         f"Test aborted: {abort_reason_clean}\n"
@@ -268,7 +504,7 @@ def append_abort_to_json(json_file: str, testfile: str, abort_info: Dict[str, An
         f"GPU ID: {abort_info.get('gpu_id', 'unknown')}"
     )
 
-    abort_test = {
+    return {
         "nodeid": test_nodeid,
         "lineno": 1,
         "outcome": "failed",
@@ -282,42 +518,112 @@ def append_abort_to_json(json_file: str, testfile: str, abort_info: Dict[str, An
         "teardown": {"duration": 0.0, "outcome": "skipped"},
     }
 
+
+def append_abort_to_json(json_file: str, testfile: str, abort_info: Dict[str, Any]) -> None:
+    """Append abort info to pytest-json-report formatted JSON."""
+    append_aborts_to_json(json_file, testfile, [abort_info])
+
+
+def append_aborts_to_json(
+    json_file: str,
+    testfile: str,
+    abort_infos: List[Dict[str, Any]],
+    *,
+    now: Optional[datetime] = None,
+) -> None:
+    """Append several abort records to pytest-json-report JSON in one read+write."""
+    _append_abort_items_to_json(json_file, [(testfile, abort_info) for abort_info in abort_infos], now=now)
+
+
+def _atomic_write_text(path: str, text: str) -> None:
+    """Write text to path via a temp file + os.replace (no torn reports)."""
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _append_abort_items_to_json(
+    json_file: str,
+    items: List[Tuple[str, Dict[str, Any]]],
+    *,
+    now: Optional[datetime] = None,
+) -> None:
+    """append_aborts_to_json for (testfile, abort_info) pairs with per-record testfiles."""
+    if not items:
+        return
+    abort_tests = [_abort_test_json(testfile, abort_info) for testfile, abort_info in items]
+    n = len(abort_tests)
+
     if os.path.exists(json_file):
-        with open(json_file, "r", encoding="utf-8") as f:
-            report_data = json.load(f)
-        report_data.setdefault("tests", []).append(abort_test)
+        with open(json_file, "rb") as f:
+            report_data = _json_loads(f.read())
+        report_data.setdefault("tests", []).extend(abort_tests)
         summary = report_data.get("summary", {})
-        summary["failed"] = summary.get("failed", 0) + 1
-        summary["total"] = summary.get("total", 0) + 1
-        summary["collected"] = summary.get("collected", 0) + 1
+        summary["failed"] = summary.get("failed", 0) + n
+        summary["total"] = summary.get("total", 0) + n
+        summary["collected"] = summary.get("collected", 0) + n
         if "unskipped_total" in summary:
-            summary["unskipped_total"] = summary["unskipped_total"] + 1
+            summary["unskipped_total"] = summary["unskipped_total"] + n
         report_data["summary"] = summary
         report_data["exitcode"] = 1
     else:
-        current_time = datetime.now().timestamp()
+        current_time = (now or datetime.now()).timestamp()
         report_data = {
             "created": current_time,
-            "duration": abort_info.get("duration", 0),
+            "duration": sum(abort_info.get("duration", 0) or 0 for _, abort_info in items),
             "exitcode": 1,
             "root": os.getcwd(),
             "environment": {},
             "summary": {
                 "passed": 0,
-                "failed": 1,
-                "total": 1,
-                "collected": 1,
-                "unskipped_total": 1,
+                "failed": n,
+                "total": n,
+                "collected": n,
+                "unskipped_total": n,
             },
-            "tests": [abort_test],
+            "tests": abort_tests,
         }
 
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(report_data, f, indent=4)
+    # Compact: the file is re-read on every later append, and
+    # pytest-json-report consumers don't need indentation.
+    _atomic_write_text(json_file, _json_dumps(report_data))
+
+
+_RELOAD_BUTTON_RE = re.compile(r'class="summary__reload__button\s*"')
 
 
 def append_abort_to_html(html_file: str, testfile: str, abort_info: Dict[str, Any]) -> None:
     """Append abort info to pytest-html report (best-effort)."""
+    append_aborts_to_html(html_file, testfile, [abort_info])
+
+
+def append_aborts_to_html(
+    html_file: str,
+    testfile: str,
+    abort_infos: List[Dict[str, Any]],
+) -> None:
+    """Append several abort records to a pytest-html report in one read+write."""
+    _append_abort_items_to_html(html_file, [(testfile, abort_info) for abort_info in abort_infos])
+
+
+def _append_abort_items_to_html(
+    html_file: str,
+    items: List[Tuple[str, Dict[str, Any]]],
+) -> bool:
+    """append_aborts_to_html for (testfile, abort_info) pairs with per-record testfiles.
+
+    Returns False if the report could not be written.
+    """
+    if not items:
+        return True
     if os.path.exists(html_file):
         try:
             with open(html_file, "r", encoding="utf-8") as f:
@@ -325,32 +631,47 @@ def append_abort_to_html(html_file: str, testfile: str, abort_info: Dict[str, An
         except OSError:
             html_content = ""
 
-        abort_row = _create_abort_row_html(testfile, abort_info)
-        if "</table>" in html_content:
-            results_table_start = html_content.find('<table id="results-table">')
-            results_table_end = html_content.find("</table>", results_table_start)
-            if results_table_end != -1:
-                html_content = (
-                    html_content[:results_table_end]
-                    + f"{abort_row}\n    "
-                    + html_content[results_table_end:]
-                )
-                html_content = _update_html_summary_counts(html_content)
-                html_content = _update_html_json_data(html_content, testfile, abort_info)
-                html_content = re.sub(
-                    r'class="summary__reload__button\s*"',
-                    'class="summary__reload__button hidden"',
-                    html_content,
-                )
-                try:
-                    with open(html_file, "w", encoding="utf-8") as f:
-                        f.write(html_content)
-                    return
-                except OSError:
-                    pass
+        results_table_start = html_content.find('<table id="results-table">')
+        results_table_end = html_content.find("</table>", results_table_start)
+        if results_table_end != -1:
+            # Every change is collected as an edit against the original text
+            # and spliced in one join, so the report is copied once.
+            rows = "".join(
+                _create_abort_row_html(testfile, abort_info) + "\n    "
+                for testfile, abort_info in items
+            )
+            edits: List[_HtmlEdit] = [(results_table_end, results_table_end, rows)]
+            edits.extend(_html_summary_count_edits(html_content, len(items)))
+            edits.extend(
+                (m.start(), m.end(), 'class="summary__reload__button hidden"')
+                for m in _RELOAD_BUTTON_RE.finditer(html_content)
+            )
+            blob_edit = _html_json_data_edit(html_content, items)
+            if blob_edit is not None:
+                # The blob is replaced wholesale; drop edits that fell inside it.
+                edits = [e for e in edits if not blob_edit[0] <= e[0] < blob_edit[1]]
+                edits.append(blob_edit)
+            html_content = _apply_html_edits(html_content, edits)
+            try:
+                _atomic_write_text(html_file, html_content)
+                return True
+            except OSError:
+                pass
+
+    # Fallback: create a standalone HTML report that pytest_html_merger can read,
+    # then append any remaining records to it.
+    if not _create_new_html_file(html_file, *items[0]):
+        return False
+    if len(items) > 1:
+        return _append_abort_items_to_html(html_file, items[1:])
+    return True
 
-    # Fallback: create a standalone HTML report that pytest_html_merger can read.
-    _create_new_html_file(html_file, testfile, abort_info)
+
+def _format_duration(duration: float) -> str:
+    """Format seconds as HH:MM:SS (fractional seconds are dropped)."""
+    minutes, seconds = divmod(math.floor(duration), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
 def _create_abort_row_html(testfile: str, abort_info: Dict[str, Any]) -> str:
@@ -371,10 +692,7 @@ def _create_abort_row_html(testfile: str, abort_info: Dict[str, Any]) -> str:
     abort_time = abort_info.get("abort_time", "")
     gpu_id = abort_info.get("gpu_id", "unknown")
 
-    hours = int(duration // 3600)
-    minutes = int((duration % 3600) // 60)
-    seconds = int(duration % 60)
-    duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    duration_str = _format_duration(duration)
 
     abort_reason = sanitize_for_json(abort_info.get("reason", "Test aborted or crashed."))
     test_class_clean = sanitize_for_json(str(test_class))
@@ -408,119 +726,137 @@ def _create_abort_row_html(testfile: str, abort_info: Dict[str, Any]) -> str:
                 </tbody>"""
 
 
-def _update_html_summary_counts(html_content: str) -> str:
-    """Update pytest-html summary counts for an appended failed test."""
-    malformed_pattern = r"(\d+/\d+ test done\.)"
-    if re.search(malformed_pattern, html_content):
-        html_content = re.sub(malformed_pattern, "1 tests took 00:00:01.", html_content)
-
-    count_pattern = r"(\d+) tests? ran in"
-    match = re.search(count_pattern, html_content)
-    if match:
-        current_count = int(match.group(1))
-        html_content = re.sub(count_pattern, f"{current_count + 1} tests ran in", html_content)
-
-    count_pattern2 = r"(\d+) tests? took"
-    match = re.search(count_pattern2, html_content)
-    if match:
-        current_count = int(match.group(1))
-        html_content = re.sub(count_pattern2, f"{current_count + 1} tests took", html_content)
-
-    failed_pattern = r"(\d+) Failed"
-    match = re.search(failed_pattern, html_content)
-    if match:
-        current_failed = int(match.group(1))
-        html_content = re.sub(failed_pattern, f"{current_failed + 1} Failed", html_content)
-    else:
-        html_content = html_content.replace("0 Failed,", "1 Failed,")
-        html_content = html_content.replace(
-            'data-test-result="failed" disabled',
-            'data-test-result="failed"',
-        )
-    return html_content
+# All summary count tokens, matched in one scan. Each alternative has exactly
+# one named group so Match.lastgroup identifies which token was found.
+_SUMMARY_COUNTS_RE = re.compile(
+    r"(?P<malformed>\d+/\d+ test done\.)"
+    r"|(?P<ran>\d+) tests? ran in"
+    r"|(?P<took>\d+) tests? took"
+    r"|(?P<failed>\d+) Failed"
+)
 
 
-def _update_html_json_data(html_content: str, testfile: str, abort_info: Dict[str, Any]) -> str:
-    """Update pytest-html data-jsonblob by adding the aborted test entry."""
-    jsonblob_pattern = r'data-jsonblob="([^"]*)"'
-    match = re.search(jsonblob_pattern, html_content)
-    if not match:
-        return html_content
+# (start, end, replacement) against the original report text.
+_HtmlEdit = Tuple[int, int, str]
 
-    try:
-        raw_attr = match.group(1)
-        json_str = html.unescape(raw_attr)
-        try:
-            existing_json = json.loads(json_str)
-        except (json.JSONDecodeError, ValueError):
-            # Repair malformed jsonblobs produced by crashes/merges.
-            existing_json = json.loads(_escape_control_chars_in_json_strings(json_str))
 
-        if "tests" not in existing_json or not isinstance(existing_json.get("tests"), dict):
-            existing_json["tests"] = {}
+def _apply_html_edits(html_content: str, edits: List[_HtmlEdit]) -> str:
+    """Splice non-overlapping edits into html_content with a single join."""
+    parts = []
+    pos = 0
+    for start, end, replacement in sorted(edits, key=lambda e: (e[0], e[1])):
+        parts.append(html_content[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(html_content[pos:])
+    return "".join(parts)
 
-        test_name = abort_info["test_name"]
-        duration = float(abort_info.get("duration", 0) or 0)
-        abort_time = abort_info.get("abort_time", "")
-        gpu_id = abort_info.get("gpu_id", "unknown")
 
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
-        duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+def _html_summary_count_edits(html_content: str, added: int = 1) -> List[_HtmlEdit]:
+    """Edits updating pytest-html summary counts for `added` appended failed tests."""
+    matches = list(_SUMMARY_COUNTS_RE.finditer(html_content))
 
-        test_id = f"test_{len(existing_json['tests'])}"
+    # Every occurrence of a token is rewritten from the first one's count.
+    # A malformed "N/M test done." reads as "1 tests took 00:00:01.".
+    counts: Dict[str, int] = {}
+    for m in matches:
+        kind = m.lastgroup
+        if kind == "malformed":
+            counts.setdefault("took", 1)
+        else:
+            counts.setdefault(kind, int(m.group(kind)))
 
-        abort_reason = sanitize_for_json(abort_info.get("reason", "Test aborted or crashed."))
-        abort_time_clean = sanitize_for_json(str(abort_time))
-        gpu_id_clean = sanitize_for_json(str(gpu_id))
+    replacements = {
+        "malformed": f"{counts.get('took', 0) + added} tests took 00:00:01.",
+        "ran": f"{counts.get('ran', 0) + added} tests ran in",
+        "took": f"{counts.get('took', 0) + added} tests took",
+        "failed": f"{counts.get('failed', 0) + added} Failed",
+    }
+    edits = [(m.start(), m.end(), replacements[m.lastgroup]) for m in matches]
+
+    if "failed" not in counts:
+        # No "N Failed" token at all (so no "0 Failed," either): just enable
+        # the failed-results filter.
+        needle = 'data-test-result="failed" disabled'
+        i = html_content.find(needle)
+        while i >= 0:
+            edits.append((i, i + len(needle), 'data-test-result="failed"'))
+            i = html_content.find(needle, i + len(needle))
+    return edits
+
+
+def _abort_jsonblob_test(testfile: str, abort_info: Dict[str, Any], test_id: str) -> Dict[str, Any]:
+    """Build the pytest-html jsonblob test entry for one abort record."""
+    test_name = abort_info["test_name"]
+    duration = float(abort_info.get("duration", 0) or 0)
+    abort_time = abort_info.get("abort_time", "")
+    gpu_id = abort_info.get("gpu_id", "unknown")
 
-        log_msg = (
-            f"Test aborted: {abort_reason}\n"
-            f"Abort detected at: {abort_time_clean}\n"
-            f"GPU ID: {gpu_id_clean}"
-        )
+    duration_str = _format_duration(duration)
 
-        # Preserve an existing nodeid-like identifier; otherwise,
-        # synthesize one anchored to the current testfile (without assuming a
-        # particular tests/ root directory).
-        testid_display = (
-            test_name
-            if ("::" in test_name and test_name.split("::", 1)[0].endswith(".py"))
-            else f"{testfile}.py::{test_name}"
-        )
+    abort_reason = sanitize_for_json(abort_info.get("reason", "Test aborted or crashed."))
+    abort_time_clean = sanitize_for_json(str(abort_time))
+    gpu_id_clean = sanitize_for_json(str(gpu_id))
 
-        new_test = {
-            "testId": testid_display,
-            "id": test_id,
-            "log": log_msg,
-            "extras": [],
-            "resultsTableRow": [
-                '<td class="col-result">Failed</td>',
-                f'<td class="col-name">{testid_display}</td>',
-                f'<td class="col-duration">{duration_str}</td>',
-                '<td class="col-links"></td>',
-            ],
-            "tableHtml": [],
-            "result": "failed",
-            "collapsed": False,
-        }
-        existing_json["tests"][test_id] = new_test
+    log_msg = (
+        f"Test aborted: {abort_reason}\n"
+        f"Abort detected at: {abort_time_clean}\n"
+        f"GPU ID: {gpu_id_clean}"
+    )
 
-        updated_json_str = html.escape(
-            json.dumps(existing_json, ensure_ascii=False), quote=True
-        )
-        # Avoid regex replacement pitfalls with backslashes in the json blob:
-        # do a single targeted replacement of the attribute content.
-        html_content = (
-            html_content[: match.start(1)]
-            + updated_json_str
-            + html_content[match.end(1) :]
-        )
+    # Preserve an existing nodeid-like identifier; otherwise,
+    # synthesize one anchored to the current testfile (without assuming a
+    # particular tests/ root directory).
+    testid_display = (
+        test_name
+        if ("::" in test_name and test_name.split("::", 1)[0].endswith(".py"))
+        else f"{testfile}.py::{test_name}"
+    )
+
+    return {
+        "testId": testid_display,
+        "id": test_id,
+        "log": log_msg,
+        "extras": [],
+        "resultsTableRow": [
+            '<td class="col-result">Failed</td>',
+            f'<td class="col-name">{testid_display}</td>',
+            f'<td class="col-duration">{duration_str}</td>',
+            '<td class="col-links"></td>',
+        ],
+        "tableHtml": [],
+        "result": "failed",
+        "collapsed": False,
+    }
+
+
+def _html_json_data_edit(
+    html_content: str,
+    items: List[Tuple[str, Dict[str, Any]]],
+) -> Optional[_HtmlEdit]:
+    """Edit replacing pytest-html's data-jsonblob with one including the aborts."""
+    span = _find_jsonblob_attr(html_content)
+    if span is None:
+        return None
+
+    try:
+        raw_attr = html_content[span[0] : span[1]]
+        # Repairs malformed jsonblobs produced by crashes/merges.
+        existing_json, _ = _parse_jsonblob_text(_unescape_jsonblob_attr(raw_attr))
+
+        if "tests" not in existing_json or not isinstance(existing_json.get("tests"), dict):
+            existing_json["tests"] = {}
+
+        for testfile, abort_info in items:
+            test_id = f"test_{len(existing_json['tests'])}"
+            existing_json["tests"][test_id] = _abort_jsonblob_test(testfile, abort_info, test_id)
+
+        # A targeted replacement of the attribute content avoids regex
+        # replacement pitfalls with backslashes in the json blob.
+        return span[0], span[1], _encode_jsonblob_attr(existing_json)
     except (json.JSONDecodeError, ValueError, TypeError) as ex:
         print(f"Warning: Could not update JSON data in HTML file: {ex}")
-
-    return html_content
+    return None
 
 
 def _generate_html_template(template_data: Dict[str, str]) -> str:
@@ -624,18 +960,15 @@ def _generate_html_template(template_data: Dict[str, str]) -> str:
         </html>"""
 
 
-def _create_new_html_file(html_file: str, testfile: str, abort_info: Dict[str, Any]) -> None:
-    """Create a standalone HTML file for an abort-only report."""
+def _create_new_html_file(html_file: str, testfile: str, abort_info: Dict[str, Any]) -> bool:
+    """Create a standalone HTML file for an abort-only report; False on failure."""
     try:
         test_name = abort_info["test_name"]
         duration = float(abort_info.get("duration", 0) or 0)
         abort_time = abort_info.get("abort_time", "")
         gpu_id = abort_info.get("gpu_id", "unknown")
 
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
-        duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        duration_str = _format_duration(duration)
 
         abort_reason = sanitize_for_json(abort_info.get("reason", "Test aborted or crashed."))
         abort_time_clean = sanitize_for_json(str(abort_time))
@@ -675,7 +1008,7 @@ def _create_new_html_file(html_file: str, testfile: str, abort_info: Dict[str, A
             "title": f"{testfile}_log.html",
         }
 
-        json_blob = html.escape(json.dumps(json_data, ensure_ascii=False), quote=True)
+        json_blob = _encode_jsonblob_attr(json_data)
         current_time_str = datetime.now().strftime("%d-%b-%Y at %H:%M:%S")
 
         html_content = _generate_html_template(
@@ -692,8 +1025,12 @@ def _create_new_html_file(html_file: str, testfile: str, abort_info: Dict[str, A
         os.makedirs(os.path.dirname(html_file) or ".", exist_ok=True)
         with open(html_file, "w", encoding="utf-8") as f:
             f.write(html_content)
+        return True
     except Exception:  # pylint: disable=broad-exception-caught
+        import traceback  # pylint: disable=import-outside-toplevel
+
         traceback.print_exc()
+        return False
 
 
 def handle_abort(
@@ -707,33 +1044,62 @@ def handle_abort(
     if crash_info is None:
         crash_info = check_for_crash_file(last_running_file)
 
-    if os.path.exists(last_running_file):
-        try:
-            os.remove(last_running_file)
-        except OSError:
-            pass
+    try:
+        os.remove(last_running_file)
+    except OSError:
+        # Includes FileNotFoundError when no marker was left behind.
+        pass
 
     if not crash_info:
         return False
 
+    return handle_aborts(json_file, html_file, testfile, [crash_info])
+
+
+def handle_aborts(
+    json_file: str,
+    html_file: str,
+    testfile: str,
+    crash_infos: List[Dict[str, Any]],
+) -> bool:
+    """Append several crash records into JSON+HTML reports.
+
+    Each report is read, patched and written once for the whole batch.
+    """
+    if not crash_infos:
+        return False
+
     try:
+        now = datetime.now()
         crash_log_file = os.environ.get(ENV_CRASHED_TESTS_LOG)
         if crash_log_file:
-            append_crash_to_jsonl(crash_log_file, crash_info, source="runner")
-        append_abort_to_json(json_file, testfile, crash_info)
-        append_abort_to_html(html_file, testfile, crash_info)
+            for crash_info in crash_infos:
+                append_crash_to_jsonl(crash_log_file, crash_info, source="runner", now=now)
+        append_aborts_to_json(json_file, testfile, crash_infos, now=now)
+        append_aborts_to_html(html_file, testfile, crash_infos)
         return True
     except Exception:  # pylint: disable=broad-exception-caught
+        import traceback  # pylint: disable=import-outside-toplevel
+
         traceback.print_exc()
         return False
 
 
+_PATH_SEP_TO_DOT = str.maketrans("/\\", "..")
+
+
+@functools.lru_cache(maxsize=4096)
 def _nodeid_to_csv_fields(nodeid: str) -> Dict[str, str]:
-    """Best-effort mapping of a pytest nodeid into pytest-csv fields."""
+    """Best-effort mapping of a pytest nodeid into pytest-csv fields.
+
+    Memoized across calls in a process; callers must not mutate the result.
+    """
     # nodeid format: "path/to/test_file.py::TestCls::test_name[param]"
-    file_part = nodeid.split("::", 1)[0] if "::" in nodeid else ""
-    name_part = nodeid.split("::")[-1] if "::" in nodeid else nodeid
-    module_part = file_part.replace("/", ".").replace("\\", ".")
+    file_part, sep, rest = nodeid.partition("::")
+    if not sep:
+        return {"file": "", "name": nodeid, "module": ""}
+    name_part = rest.split("::")[-1]
+    module_part = file_part.translate(_PATH_SEP_TO_DOT)
     if module_part.endswith(".py"):
         module_part = module_part[: -len(".py")]
     return {"file": file_part, "name": name_part, "module": module_part}
@@ -759,47 +1125,119 @@ def _normalize_crash_record(rec: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
-def append_abort_to_csv(csv_file: str, abort_info: Dict[str, Any]) -> None:
+def _read_csv_header_and_ids(f, ids: Optional[Set[str]] = None) -> List[str]:
+    """Return a pytest-csv file's header; with ids, also collect its row ids.
+
+    Each row contributes its "id" value, or "nodeid" when "id" is empty. Uses
+    csv.reader and column indexes rather than a dict per row.
+    """
+    import csv  # pylint: disable=import-outside-toplevel
+
+    reader = csv.reader(f)
+    header = next(reader, None) or []
+    if ids is None:
+        return header
+    cols = [header.index(c) for c in ("id", "nodeid") if c in header]
+    if not cols:
+        return header
+    for row in reader:
+        rid = ""
+        for i in cols:
+            if i < len(row) and row[i]:
+                rid = row[i]
+                break
+        rid = rid.strip()
+        if rid:
+            ids.add(rid)
+    return header
+
+
+# Default header used by pytest-csv.
+_CSV_DEFAULT_FIELDS = (
+    "id",
+    "module",
+    "name",
+    "file",
+    "doc",
+    "markers",
+    "status",
+    "message",
+    "duration",
+)
+_CSV_EMPTY_ROW: Dict[str, str] = dict.fromkeys(_CSV_DEFAULT_FIELDS, "")
+
+
+def append_abort_to_csv(
+    csv_file: str, abort_info: Dict[str, Any], *, existing_ids: Optional[Set[str]] = None
+) -> None:
     """Append a synthetic crash row to a pytest-csv report (best-effort)."""
-    nodeid = abort_info.get("nodeid") or abort_info.get("test_name") or ""
-    if not isinstance(nodeid, str) or not nodeid.strip():
-        return
-    nodeid = nodeid.strip()
+    append_aborts_to_csv(csv_file, [abort_info], existing_ids=existing_ids)
 
-    os.makedirs(os.path.dirname(csv_file) or ".", exist_ok=True)
 
-    # Default header used by pytest-csv.
-    default_fields = [
-        "id",
-        "module",
-        "name",
-        "file",
-        "doc",
-        "markers",
-        "status",
-        "message",
-        "duration",
-    ]
-
-    existing_ids: Set[str] = set()
-    fieldnames = list(default_fields)
+def append_aborts_to_csv(
+    csv_file: str,
+    abort_infos: List[Dict[str, Any]],
+    *,
+    existing_ids: Optional[Set[str]] = None,
+) -> None:
+    """Append synthetic crash rows to a pytest-csv report in one write (best-effort).
+
+    Records whose nodeid is already in the CSV (or earlier in abort_infos) are
+    skipped. Callers that already know the CSV's ids can pass them as
+    existing_ids to skip re-scanning the file; the set is updated in place with
+    the appended nodeids.
+    """
+    if not abort_infos:
+        return
+    import csv  # pylint: disable=import-outside-toplevel
+
+    fieldnames = list(_CSV_DEFAULT_FIELDS)
+    scan_ids = existing_ids is None
+    if existing_ids is None:
+        existing_ids = set()
 
     if os.path.exists(csv_file):
         try:
             with open(csv_file, "r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames:
-                    fieldnames = list(reader.fieldnames)
-                for row in reader:
-                    rid = row.get("id") or row.get("nodeid") or ""
-                    if isinstance(rid, str) and rid.strip():
-                        existing_ids.add(rid.strip())
+                # With caller-provided ids, only the header is needed.
+                header = _read_csv_header_and_ids(f, existing_ids if scan_ids else None)
+            if header:
+                fieldnames = header
         except OSError:
             pass
 
-    if nodeid in existing_ids:
+    if tuple(fieldnames) == _CSV_DEFAULT_FIELDS:
+        template = _CSV_EMPTY_ROW
+    else:
+        template = dict.fromkeys(fieldnames, "")
+    rows = []
+    for abort_info in abort_infos:
+        nodeid = abort_info.get("nodeid") or abort_info.get("test_name") or ""
+        if not isinstance(nodeid, str) or not nodeid.strip():
+            continue
+        nodeid = nodeid.strip()
+        if nodeid in existing_ids:
+            continue
+        existing_ids.add(nodeid)
+        rows.append(_abort_csv_row(template, nodeid, abort_info))
+    if not rows:
         return
 
+    # Append rows; create header if needed.
+    os.makedirs(os.path.dirname(csv_file) or ".", exist_ok=True)
+    try:
+        write_header = os.stat(csv_file).st_size == 0
+    except FileNotFoundError:
+        write_header = True
+    with open(csv_file, "a", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        if write_header:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def _abort_csv_row(template: Dict[str, str], nodeid: str, abort_info: Dict[str, Any]) -> Dict[str, str]:
+    """Build a pytest-csv row dict (over template's keys) for one abort record."""
     fields = _nodeid_to_csv_fields(nodeid)
     reason = abort_info.get("reason", "Test aborted or crashed.")
     if not isinstance(reason, str):
@@ -810,33 +1248,84 @@ def append_abort_to_csv(csv_file: str, abort_info: Dict[str, Any]) -> None:
     except Exception:  # pylint: disable=broad-exception-caught
         duration_str = "0.0"
 
-    row = {k: "" for k in fieldnames}
-    if "id" in row:
+    row = template.copy()
+    if template is _CSV_EMPTY_ROW:
         row["id"] = nodeid
-    if "nodeid" in row:
-        row["nodeid"] = nodeid
-    if "module" in row:
         row["module"] = fields["module"]
-    if "name" in row:
         row["name"] = fields["name"]
-    if "file" in row:
         row["file"] = fields["file"]
-    if "status" in row:
         row["status"] = "failed"
-    if "outcome" in row:
-        row["outcome"] = "failed"
-    if "message" in row:
         row["message"] = reason
-    if "duration" in row:
         row["duration"] = duration_str
+        return row
+
+    # Custom header: only fill the columns it has.
+    values = {
+        "id": nodeid,
+        "nodeid": nodeid,
+        "module": fields["module"],
+        "name": fields["name"],
+        "file": fields["file"],
+        "status": "failed",
+        "outcome": "failed",
+        "message": reason,
+        "duration": duration_str,
+    }
+    for k, v in values.items():
+        if k in row:
+            row[k] = v
+    return row
 
-    # Append row; create header if needed.
-    write_header = not os.path.exists(csv_file) or os.path.getsize(csv_file) == 0
-    with open(csv_file, "a", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(row)
+
+_COL_NAME_RE = re.compile(rb'<td class="col-name">([^<]*)</td>')
+
+
+def _html_report_nodeids(html_buf) -> Set[str]:
+    """Collect the nodeids a pytest-html report already lists (best-effort).
+
+    html_buf is the raw report bytes (or an mmap of the file), so only the
+    matched names and the jsonblob are decoded. Looks at rendered result rows
+    and at the data-jsonblob test entries.
+    """
+    nodeids = {
+        html.unescape(m.group(1).decode("utf-8", "replace")).strip()
+        for m in _COL_NAME_RE.finditer(html_buf)
+    }
+
+    span = _find_jsonblob_attr(html_buf)
+    if span is not None:
+        try:
+            blob, _ = _parse_jsonblob_text(
+                _unescape_jsonblob_attr(html_buf[span[0] : span[1]].decode("utf-8"))
+            )
+        except (json.JSONDecodeError, ValueError):
+            blob = None
+        tests = blob.get("tests") if isinstance(blob, dict) else None
+        if isinstance(tests, dict):
+            # pytest-html keys tests by nodeid with a list of results each;
+            # synthesized abort entries are single dicts keyed "test_<n>".
+            for key, entries in tests.items():
+                nodeids.add(key.strip())
+                for entry in entries if isinstance(entries, list) else [entries]:
+                    if isinstance(entry, dict) and isinstance(entry.get("testId"), str):
+                        nodeids.add(entry["testId"].strip())
+    nodeids.discard("")
+    return nodeids
+
+
+def _postprocess_stamp_key(crash_log_state: str, report_files: List[Optional[str]]) -> str:
+    """Fingerprint a postprocess run: crash log + report stat info."""
+    parts = [crash_log_state]
+    for path in report_files:
+        if not path:
+            parts.append("-")
+            continue
+        try:
+            st = os.stat(path)
+            parts.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"{path}:missing")
+    return "\n".join(parts)
 
 
 def postprocess_reports_from_crash_log(
@@ -846,74 +1335,122 @@ def postprocess_reports_from_crash_log(
     html_report_file: Optional[str] = None,
     csv_report_file: Optional[str] = None,
 ) -> None:
-    """Patch reports with synthetic failures for crashed nodeids from crash_log_file."""
+    """Patch reports with synthetic failures for crashed nodeids from crash_log_file.
+
+    A "<crash_log_file>.postprocess.stamp" sidecar records the crash log and
+    reports as left by the last run that patched every report; when nothing
+    changed since, the run is skipped. Deleting the sidecar forces a full run.
+    """
+    report_files = [json_report_file, html_report_file, csv_report_file]
+    stamp_file = f"{crash_log_file}.postprocess.stamp"
+    try:
+        st = os.stat(crash_log_file)
+    except OSError:
+        return
+    # Same (mtime, size) check retry.py uses to spot a changed crash log.
+    crash_log_state = f"{crash_log_file}:{st.st_mtime_ns}:{st.st_size}"
     try:
-        with open(crash_log_file, "r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
+        with open(stamp_file, "r", encoding="utf-8") as f:
+            if f.read() == _postprocess_stamp_key(crash_log_state, report_files):
+                return
     except OSError:
+        pass
+
+    if not _postprocess_reports(crash_log_file, json_report_file, html_report_file, csv_report_file):
+        # Something was left unpatched; don't let the stamp skip the retry.
         return
 
-    # Collect unique crashes in order.
+    # The crash log state is from before this run; only the reports changed.
+    try:
+        _atomic_write_text(stamp_file, _postprocess_stamp_key(crash_log_state, report_files))
+    except OSError:
+        pass
+
+
+def _postprocess_reports(
+    crash_log_file: str,
+    json_report_file: Optional[str],
+    html_report_file: Optional[str],
+    csv_report_file: Optional[str],
+) -> bool:
+    """Patch the reports; False if any report or its existing ids could not be read/written."""
+    # Collect unique crashes in order, streaming the log line by line.
     seen: Set[str] = set()
     crashes: list[Dict[str, Any]] = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            rec = json.loads(line)
-        except (json.JSONDecodeError, ValueError):
-            continue
-        if not isinstance(rec, dict):
-            continue
-        rec = _normalize_crash_record(rec)
-        nid = rec.get("nodeid", "")
-        if not isinstance(nid, str) or not nid.strip():
-            continue
-        nid = nid.strip()
-        if nid in seen:
-            continue
-        seen.add(nid)
-        crashes.append(rec)
+    try:
+        with open(crash_log_file, "r", encoding="utf-8", buffering=1 << 20) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = _json_loads(line)
+                except (json.JSONDecodeError, ValueError):
+                    continue
+                if not isinstance(rec, dict):
+                    continue
+                rec = _normalize_crash_record(rec)
+                nid = rec.get("nodeid", "")
+                if not isinstance(nid, str) or not nid.strip():
+                    continue
+                nid = nid.strip()
+                if nid in seen:
+                    continue
+                seen.add(nid)
+                crashes.append(rec)
+    except OSError:
+        return False
 
     if not crashes:
-        return
+        return True
+
+    ok = True
 
     # Precompute existing nodeids to avoid duplicating entries.
     existing_json_nodeids: Set[str] = set()
     if json_report_file and os.path.exists(json_report_file):
         try:
-            with open(json_report_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and isinstance(data.get("tests"), list):
-                for t in data["tests"]:
-                    if isinstance(t, dict):
-                        nid = t.get("nodeid")
+            if ijson is not None:
+                # Stream only the nodeids instead of materializing the report.
+                with open(json_report_file, "rb") as f:
+                    for nid in ijson.items(f, "tests.item.nodeid"):
                         if isinstance(nid, str) and nid.strip():
                             existing_json_nodeids.add(nid.strip())
+            else:
+                with open(json_report_file, "rb") as f:
+                    data = _json_loads(f.read())
+                if isinstance(data, dict) and isinstance(data.get("tests"), list):
+                    for t in data["tests"]:
+                        if isinstance(t, dict):
+                            nid = t.get("nodeid")
+                            if isinstance(nid, str) and nid.strip():
+                                existing_json_nodeids.add(nid.strip())
         except Exception:  # pylint: disable=broad-exception-caught
-            pass
+            ok = False
 
     existing_csv_ids: Set[str] = set()
     if csv_report_file and os.path.exists(csv_report_file):
         try:
             with open(csv_report_file, "r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    rid = row.get("id") or row.get("nodeid") or ""
-                    if isinstance(rid, str) and rid.strip():
-                        existing_csv_ids.add(rid.strip())
+                _read_csv_header_and_ids(f, existing_csv_ids)
         except Exception:  # pylint: disable=broad-exception-caught
-            pass
+            ok = False
 
-    html_content = ""
+    existing_html_nodeids: Set[str] = set()
     if html_report_file and os.path.exists(html_report_file):
         try:
-            with open(html_report_file, "r", encoding="utf-8") as f:
-                html_content = f.read()
-        except OSError:
-            html_content = ""
-
+            # Scan the mapped file as bytes instead of decoding it into a str.
+            with open(html_report_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        existing_html_nodeids = _html_report_nodeids(mm)
+        except (OSError, ValueError):
+            ok = False
+
+    # Collect what each report is missing, then patch each report once.
+    json_items: List[Tuple[str, Dict[str, Any]]] = []
+    csv_infos: List[Dict[str, Any]] = []
+    html_items: List[Tuple[str, Dict[str, Any]]] = []
     for rec in crashes:
         nid = rec["nodeid"].strip()
         # Derive a reasonable testfile fallback (used only when nodeid isn't file-qualified).
@@ -922,20 +1459,19 @@ def postprocess_reports_from_crash_log(
             testfile = testfile[: -len(".py")]
 
         if json_report_file and nid not in existing_json_nodeids:
-            append_abort_to_json(json_report_file, testfile=testfile, abort_info=rec)
-            existing_json_nodeids.add(nid)
+            json_items.append((testfile, rec))
 
         if csv_report_file and nid not in existing_csv_ids:
-            append_abort_to_csv(csv_report_file, rec)
-            existing_csv_ids.add(nid)
-
-        if html_report_file:
-            # Best-effort dedupe: skip if the nodeid already appears in the HTML.
-            if html_content and nid in html_content:
-                continue
-            append_abort_to_html(html_report_file, testfile=testfile, abort_info=rec)
-            try:
-                with open(html_report_file, "r", encoding="utf-8") as f:
-                    html_content = f.read()
-            except OSError:
-                html_content = ""
+            csv_infos.append(rec)
+
+        if html_report_file and nid not in existing_html_nodeids:
+            html_items.append((testfile, rec))
+            existing_html_nodeids.add(nid)
+
+    if json_report_file:
+        _append_abort_items_to_json(json_report_file, json_items)
+    if csv_report_file:
+        append_aborts_to_csv(csv_report_file, csv_infos, existing_ids=existing_csv_ids)
+    if html_report_file and not _append_abort_items_to_html(html_report_file, html_items):
+        ok = False
+    return ok
@@ -9,10 +9,16 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 @dataclass(frozen=True)
 class CrashInfo:
@@ -39,35 +45,39 @@ class CrashInfo:
 
 
 def _extract_test_class(nodeid: str) -> str:
-    if "::" not in nodeid:
+    # Second "::" component: the class for file::Class::test, else the test.
+    _, sep, rest = nodeid.partition("::")
+    if not sep:
         return "UnknownClass"
-    parts = nodeid.split("::")
-    if len(parts) >= 3:
-        return parts[1]
-    if len(parts) == 2:
-        return parts[1]
-    return "UnknownClass"
+    return rest.partition("::")[0]
 
 
 def check_for_crash_file(last_running_file: str, *, min_duration: float = 0.1) -> Optional[Dict[str, Any]]:
     """Return crash info dict if crash detected, otherwise None.
 
     A crash is detected when the last_running_file exists and contains JSON with
-    status='running'. This file should be deleted on normal test completion by
-    the plugin.
+    status='running'. The plugin empties this file on normal test completion
+    and deletes it at session end.
     """
-    if not os.path.exists(last_running_file):
-        return None
-
     try:
-        with open(last_running_file, "r", encoding="utf-8") as f:
-            crash_data = json.load(f)
+        if not os.stat(last_running_file).st_size:
+            # Emptied by the plugin when the last test finished: no crash.
+            return None
+        with open(last_running_file, "rb") as f:
+            data = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        crash_data = orjson.loads(data) if orjson is not None else json.loads(data)
 
         if crash_data.get("status") != "running":
             return None
 
-        start_time = datetime.fromisoformat(crash_data["start_time"])
-        duration = (datetime.now() - start_time).total_seconds()
+        start_time_ns = crash_data.get("start_time_ns")
+        if start_time_ns is not None:
+            duration = (time.time_ns() - int(start_time_ns)) / 1e9
+        else:
+            # Markers from older plugin versions carry an ISO timestamp.
+            start_time = datetime.fromisoformat(crash_data["start_time"])
+            duration = (datetime.now() - start_time).total_seconds()
 
         # Avoid false positives from extremely short runtimes.
         if duration < min_duration:
@@ -98,5 +108,6 @@ def check_for_crash_file(last_running_file: str, *, min_duration: float = 0.1) -
             pass
         return None
     except OSError:
+        # Includes FileNotFoundError: no marker means no crash.
         return None
 
@@ -20,17 +20,15 @@ def archive_logs_dir_if_nonempty(
     Returns the archive path if an archive happened, otherwise None.
     """
     log_dir = os.path.abspath(log_dir)
-    if not (os.path.exists(log_dir) and os.path.isdir(log_dir)):
-        return None
-
+    # A missing path or non-directory raises here, so no separate exists/isdir
+    # checks; only the first entry is needed to know the dir is non-empty.
     try:
-        entries = os.listdir(log_dir)
+        with os.scandir(log_dir) as it:
+            if next(it, None) is None:
+                return None
     except OSError:
         return None
 
-    if not entries:
-        return None
-
     if timestamp is None:
         timestamp = datetime.now().strftime(timestamp_fmt)
 
@@ -9,16 +9,21 @@ with status="running". An outer process can parse it to report the crashed test.
 
 from __future__ import annotations
 
-import json
 import os
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from json.encoder import encode_basestring_ascii
+from typing import Optional, Set
 
 import pytest
 
 from .abort_handling import ENV_CRASHED_TESTS_LOG, append_crash_to_jsonl
 from .crash_file import check_for_crash_file
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 # Generic env vars
 ENV_LAST_RUNNING_FILE = "PYTEST_ABORT_LAST_RUNNING_FILE"
@@ -28,11 +33,61 @@ OPT_LAST_RUNNING_FILE = "abort_last_running_file"
 OPT_LAST_RUNNING_DIR = "abort_last_running_dir"
 
 
-def _atomic_write_json(path: str, payload: Dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+# Parent dirs already created in this process, so the per-test marker write
+# does not re-issue makedirs for the same directory.
+_ensured_dirs: Set[str] = set()
+
+
+def _ensure_parent_dir(path: str, *, force: bool = False) -> None:
+    d = os.path.dirname(path) or "."
+    if force or d not in _ensured_dirs:
+        os.makedirs(d, exist_ok=True)
+        _ensured_dirs.add(d)
+
+
+# Fixed-schema marker used when orjson is unavailable: the generic stdlib
+# encoder costs ~10x more than filling this template.
+_MARKER_TEMPLATE = (
+    '{"test_name":%s,"nodeid":%s,"start_time_ns":%d,"status":"running","pid":%d,"gpu_id":%s}'
+)
+
+
+def _format_marker_bytes(test_name: str, nodeid: str, start_time_ns: int, pid: int, gpu_id: str) -> bytes:
+    """Encode the last-running marker (compact JSON; the file is machine-read)."""
+    if orjson is not None:
+        return orjson.dumps(
+            {
+                "test_name": test_name,
+                "nodeid": nodeid,
+                "start_time_ns": start_time_ns,
+                "status": "running",
+                "pid": pid,
+                "gpu_id": gpu_id,
+            }
+        )
+    return (
+        _MARKER_TEMPLATE
+        % (
+            encode_basestring_ascii(test_name),
+            encode_basestring_ascii(nodeid),
+            start_time_ns,
+            pid,
+            encode_basestring_ascii(gpu_id),
+        )
+    ).encode("ascii")
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    _ensure_parent_dir(path)
     tmp = f"{path}.tmp.{os.getpid()}"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    try:
+        f = open(tmp, "wb")  # pylint: disable=consider-using-with
+    except FileNotFoundError:
+        # The directory went away after we cached it (e.g. logs archived).
+        _ensure_parent_dir(path, force=True)
+        f = open(tmp, "wb")  # pylint: disable=consider-using-with
+    with f:
+        f.write(data)
     os.replace(tmp, path)
 
 
@@ -83,6 +138,110 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+def _nodeid_test_name(nodeid: str) -> str:
+    """item.name for a nodeid: its last '::' part (params may contain '::')."""
+    bracket = nodeid.find("[")
+    i = (nodeid if bracket < 0 else nodeid[:bracket]).rfind("::")
+    return nodeid if i < 0 else nodeid[i + 2 :]
+
+
+def _is_xdist_controller(config: pytest.Config) -> bool:
+    # The controller replays workers' logstart/logfinish reports; only the
+    # workers (which have workerinput) actually run tests.
+    return getattr(config.option, "dist", "no") != "no" and not hasattr(config, "workerinput")
+
+
+class _LastRunningMarker:
+    """Track the currently running test in the last-running marker file.
+
+    The marker is written when a test starts (before setup). On normal
+    completion (pass/fail/skip, after teardown) it is cleared, and it is
+    deleted at session end. On hard crash, pytest never reaches cleanup.
+
+    Each instance owns its marker's fd, so a nested in-process session only
+    ever closes and removes its own marker.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.pid = os.getpid()
+        self.gpu_id = os.environ.get("HIP_VISIBLE_DEVICES", "unknown")
+        self._fd: Optional[int] = None
+
+    def write(self, data: bytes) -> None:
+        """Write the marker for a starting test through a session-long fd.
+
+        The marker is cleared (truncated) rather than deleted between tests, so
+        each test costs a pwrite/ftruncate pair. A hard crash cannot leave a
+        partial write behind: the data is in the page cache once pwrite returns.
+        """
+        if not hasattr(os, "pwrite"):
+            _atomic_write_bytes(self.path, data)
+            return
+        fd = self._fd
+        if fd is not None and os.fstat(fd).st_nlink == 0:
+            # Someone removed or replaced the marker; reopen so writes are visible.
+            self._fd = None
+            os.close(fd)
+            fd = None
+        if fd is None:
+            _ensure_parent_dir(self.path)
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o644)
+            except FileNotFoundError:
+                _ensure_parent_dir(self.path, force=True)
+                fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o644)
+            self._fd = fd
+        os.pwrite(fd, data, 0)
+        os.ftruncate(fd, len(data))
+
+    def clear(self) -> None:
+        """Mark that no test is running (an empty marker is not a crash)."""
+        if self._fd is None:
+            os.unlink(self.path)
+        else:
+            os.ftruncate(self._fd, 0)
+
+    def close(self) -> None:
+        """Close and remove this session's marker."""
+        fd, self._fd = self._fd, None
+        try:
+            if fd is not None:
+                os.close(fd)
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def pytest_runtest_logstart(self, nodeid: str, location) -> None:  # pylint: disable=unused-argument
+        data = _format_marker_bytes(_nodeid_test_name(nodeid), nodeid, time.time_ns(), self.pid, self.gpu_id)
+        try:
+            self.write(data)
+        except OSError:
+            # Don't fail the test run if we can't write.
+            pass
+
+    def pytest_runtest_logfinish(self, nodeid: str, location) -> None:  # pylint: disable=unused-argument
+        # If pytest is still alive here, it wasn't a hard crash: clear marker.
+        try:
+            self.clear()
+        except OSError:
+            # Includes FileNotFoundError when the marker was never written.
+            pass
+
+    def pytest_unconfigure(self, config: pytest.Config) -> None:  # pylint: disable=unused-argument
+        self.close()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the marker hooks when the runner provides a path.
+
+    Sessions without a path get no per-test hooks at all.
+    """
+    last_running_file = _get_last_running_file(config)
+    if last_running_file and not _is_xdist_controller(config):
+        config.pluginmanager.register(_LastRunningMarker(last_running_file), "pytest_abort_last_running")
+
+
 @pytest.hookimpl(tryfirst=True, optionalhook=True)
 def pytest_configure_node(node) -> None:
     """xdist master: assign each worker a unique last-running file path."""
@@ -114,43 +273,3 @@ def pytest_testnodedown(node, error) -> None:
     crash_info = check_for_crash_file(last_running_file, min_duration=0.0)
     if crash_info:
         append_crash_to_jsonl(crash_log_file, crash_info, source=f"xdist:{node.gateway.id}")
-
-
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_protocol(item: pytest.Item, nextitem):  # pylint: disable=unused-argument
-    """Track currently running test.
-
-    We write before running the test. On normal completion (pass/fail/skip),
-    we delete the file. On hard crash, pytest never reaches cleanup.
-    """
-    last_running_file = _get_last_running_file(item.config)
-    if not last_running_file:
-        # Plugin is inert unless runner provides a path.
-        outcome = yield
-        return outcome
-
-    payload: Dict[str, Any] = {
-        "test_name": item.name,
-        "nodeid": item.nodeid,
-        "start_time": datetime.now().isoformat(),
-        "status": "running",
-        "pid": os.getpid(),
-        "gpu_id": os.environ.get("HIP_VISIBLE_DEVICES", "unknown"),
-    }
-    try:
-        _atomic_write_json(last_running_file, payload)
-    except OSError:
-        # Don't fail the test run if we can't write.
-        pass
-
-    try:
-        outcome = yield
-        return outcome
-    finally:
-        # If pytest is still alive here, it wasn't a hard crash: remove marker.
-        try:
-            if os.path.exists(last_running_file):
-                os.remove(last_running_file)
-        except OSError:
-            pass
-
@@ -6,12 +6,21 @@ These helpers are designed to be called from an outer runner process.
 from __future__ import annotations
 
 import csv
+import itertools
 import json
 import os
 import subprocess
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from .abort_handling import sanitize_all_html_jsonblobs
+from .abort_handling import _json_loads, sanitize_all_html_jsonblobs
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore
+
+_IJSON_ERRORS: Tuple[type, ...] = (ijson.JSONError,) if ijson is not None else ()
 
 
 def combine_json_reports(log_dir: str, *, out_file: Optional[str] = None) -> str:
@@ -21,48 +30,66 @@ def combine_json_reports(log_dir: str, *, out_file: Optional[str] = None) -> str
         out_file = os.path.join(log_dir, "final_compiled_report.json")
 
     all_json_files = [f for f in os.listdir(log_dir) if f.endswith("_log.json")]
-    combined_data = []
-    for json_file in all_json_files:
-        with open(os.path.join(log_dir, json_file), "r", encoding="utf-8") as infile:
-            combined_data.append(json.load(infile))
-
-    with open(out_file, "w", encoding="utf-8") as outfile:
-        json.dump(combined_data, outfile, indent=4)
+    # The compiled report is a JSON array of the per-worker reports, so inputs
+    # are copied byte-for-byte instead of being re-serialized. Each one is still
+    # fully parsed (and the result dropped) before it is written: a report
+    # truncated by a dying worker raises here. Parts go to a temp file that
+    # replaces out_file only once every input validated, so only one input's
+    # bytes are held at a time and a failure leaves out_file untouched.
+    tmp = f"{out_file}.tmp.{os.getpid()}"
+    try:
+        with open(tmp, "wb") as outfile:
+            outfile.write(b"[\n")
+            for i, json_file in enumerate(all_json_files):
+                with open(os.path.join(log_dir, json_file), "rb") as infile:
+                    data = infile.read()
+                _json_loads(data)
+                if i:
+                    outfile.write(b",\n")
+                outfile.write(data)
+            outfile.write(b"\n]\n")
+        os.replace(tmp, out_file)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
     return out_file
 
 
+def _compiled_report_tests(f) -> Iterator[Dict[str, Any]]:
+    """Yield every test entry of a compiled report opened in binary mode."""
+    if ijson is not None:
+        # Stream test entries instead of loading the whole compiled report.
+        return ijson.items(f, "item.tests.item", use_float=True)
+    data = json.load(f)
+    return (item for report in data if "tests" in report for item in report["tests"])
+
+
 def convert_compiled_json_to_csv(json_file: str, csv_file: str) -> int:
     """Convert a compiled JSON test report (list of reports) to CSV format."""
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        test_results = []
-        for report in data:
-            if "tests" in report:
-                for item in report["tests"]:
-                    test_results.append(
-                        {
-                            "name": item.get("nodeid", ""),
-                            "outcome": item.get("outcome", ""),
-                            "duration": (
-                                item.get("call", {}).get("duration", 0)
-                                if "call" in item
-                                else 0
-                            ),
-                            "keywords": ";".join(item.get("keywords", [])),
-                        }
-                    )
-
-        with open(csv_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["name", "outcome", "duration", "keywords"]
+        with open(json_file, "rb") as f_in:
+            tests = _compiled_report_tests(f_in)
+            rows = (
+                (
+                    item.get("nodeid", ""),
+                    item.get("outcome", ""),
+                    item.get("call", {}).get("duration", 0) if "call" in item else 0,
+                    ";".join(item.get("keywords", [])),
+                )
+                for item in tests
             )
-            writer.writeheader()
-            writer.writerows(test_results)
-
-        return len(test_results)
-    except (OSError, json.JSONDecodeError, TypeError, ValueError):
+            with open(csv_file, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(("name", "outcome", "duration", "keywords"))
+                # zip() pulls a row before the counter, so the counter ends up
+                # advanced exactly once per written row.
+                counter = itertools.count()
+                writer.writerows(row for row, _ in zip(rows, counter))
+                return next(counter)
+    except (OSError, json.JSONDecodeError, TypeError, ValueError, *_IJSON_ERRORS):
         return -1
 
 
@@ -95,17 +122,23 @@ def generate_final_report(log_dir: str, *, shell: bool = False, env_vars: Option
     env = os.environ.copy()
     env.update(env_vars)
 
-    modified, total, failed = sanitize_all_html_jsonblobs(log_dir)
+    # No other threads exist yet, so the fork-based sanitize pool is safe here.
+    modified, total, failed = sanitize_all_html_jsonblobs(log_dir, max_workers=None)
     if total:
         print(f"Sanitized HTML jsonblobs: modified={modified}/{total}, failed={failed}")
 
-    ok, err = merge_html_reports(log_dir, env=env, shell=shell)
+    # The HTML merger is a subprocess writing its own output file, so let it
+    # run while the JSON/CSV reports are built here.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        merge_future = executor.submit(merge_html_reports, log_dir, env=env, shell=shell)
+
+        combined_json_file = combine_json_reports(log_dir)
+        combined_csv_file = os.path.join(os.path.abspath(log_dir), "final_compiled_report.csv")
+        convert_compiled_json_to_csv(combined_json_file, combined_csv_file)
+
+        ok, err = merge_future.result()
     if not ok:
-        print("HTML merger failed, but continuing with JSON report generation...")
+        print("HTML merger failed; JSON/CSV reports were still generated.")
         if err:
             print(err)
 
-    combined_json_file = combine_json_reports(log_dir)
-    combined_csv_file = os.path.join(os.path.abspath(log_dir), "final_compiled_report.csv")
-    convert_compiled_json_to_csv(combined_json_file, combined_csv_file)
-
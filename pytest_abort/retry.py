@@ -5,59 +5,93 @@ shell/CI to re-run pytest with `--deselect` for nodeids that previously crashed.
 
 It uses the JSONL crash log written by the plugin:
   - PYTEST_ABORT_CRASHED_TESTS_LOG
+
+When more than _ARGFILE_MIN_DESELECTS nodeids are deselected and the command
+runs this interpreter's pytest (>= 8.2), the --deselect args are passed via a
+temporary `@<argfile>` (removed once that run exits) instead of on the
+command line.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import mmap
 import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Iterable, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+# Past this many deselects, pass them through an argfile to keep argv short.
+_ARGFILE_MIN_DESELECTS = 50
+
+# Crash records are flat JSON objects, so the only unescaped `"nodeid"` key
+# on a line is the record's own; quotes inside string values are escaped.
+# JSONL records never contain raw line breaks, so the value may not span one:
+# a torn (truncated) line must not swallow the record after it.
+_NODEID_RE = re.compile(rb'"nodeid"[ \t]*:[ \t]*"([^"\\\r\n]*(?:\\[^\r\n][^"\\\r\n]*)*)"')
 
 
 def _read_crashed_nodeids_jsonl(path: Path) -> List[str]:
-    if not path.exists():
+    """Return the unique nodeids recorded in a crash JSONL log, in log order.
+
+    The nodeid values are pulled straight out of the bytes with a regex,
+    which is several times cheaper than decoding every record.
+    """
+    try:
+        f = open(path, "rb")  # pylint: disable=consider-using-with
+    except FileNotFoundError:
         return []
-    nodeids: List[str] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
+    with f:
+        if not os.fstat(f.fileno()).st_size:
+            return []
+        # Scan the mapped log in place; only the matched nodeids are copied.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            matches = _NODEID_RE.findall(mm)
+    # Insertion-ordered dict as an ordered set: dedup while reading.
+    nodeids: Dict[str, None] = {}
+    for raw in matches:
         try:
-            rec = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        nid = rec.get("nodeid")
-        if isinstance(nid, str):
-            nid = nid.strip()
-            if nid:
-                nodeids.append(nid)
-    return nodeids
-
-
-def _unique_keep_order(items: Iterable[str]) -> List[str]:
-    seen: Set[str] = set()
-    out: List[str] = []
-    for x in items:
-        if x in seen:
+            nid = json.loads(b'"' + raw + b'"') if b"\\" in raw else raw.decode("utf-8")
+        except ValueError:
             continue
-        seen.add(x)
-        out.append(x)
-    return out
+        nid = nid.strip()
+        if nid:
+            nodeids[nid] = None
+    return list(nodeids)
+
 
+def _write_argfile(args: List[str]) -> str:
+    fd, path = tempfile.mkstemp(prefix="pytest-abort-deselect-", suffix=".txt")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write("\n".join(args) + "\n")
+    return path
 
-def _build_deselect_args(nodeids: Iterable[str]) -> List[str]:
-    args: List[str] = []
-    for nid in nodeids:
-        args.append(f"--deselect={nid}")
-    return args
+
+def _pytest_supports_argfiles() -> bool:
+    # pytest 8.2 added "@file" arguments (one argument per line).
+    try:
+        major, minor = (int(x) for x in version("pytest").split(".")[:2])
+    except (PackageNotFoundError, ValueError):
+        return False
+    return (major, minor) >= (8, 2)
+
+
+def _crash_log_state(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 def _print_final_summary(*, crash_log: Path, start_count: int) -> None:
-    crashed = _unique_keep_order(_read_crashed_nodeids_jsonl(crash_log))
+    crashed = _read_crashed_nodeids_jsonl(crash_log)
     new_since_start = max(len(crashed) - start_count, 0)
     print("\n=== pytest-abort-retry summary ===")
     print(f"Crash log: {crash_log}")
@@ -121,38 +155,55 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.clear_crash_log:
         crash_log.write_text("", encoding="utf-8")
 
-    deselect_nodeids: List[str] = []
+    # Resolve the executable once instead of letting every run rescan PATH.
+    base_cmd = [shutil.which(args.pytest_cmd[0]) or args.pytest_cmd[0], *args.pytest_cmd[1:]]
+    # Only the pytest we can inspect is known to understand "@file" args.
+    use_argfile = args.pytest_cmd[:3] == [sys.executable, "-m", "pytest"] and _pytest_supports_argfiles()
+
+    # Crashed nodeids only accumulate, so the --deselect args are grown in place.
+    deselect_args: List[str] = []
+    deselected: Set[str] = set()
     start_count = len(_read_crashed_nodeids_jsonl(crash_log))
     last_rc = 2
 
     for run_idx in range(1, args.max_runs + 1):
-        cmd = list(args.pytest_cmd) + _build_deselect_args(deselect_nodeids)
+        argfile: Optional[str] = None
+        if use_argfile and len(deselect_args) > _ARGFILE_MIN_DESELECTS:
+            argfile = _write_argfile(deselect_args)
+            cmd = base_cmd + [f"@{argfile}"]
+        else:
+            cmd = base_cmd + deselect_args
         print(f"\n=== pytest-abort-retry: run {run_idx}/{args.max_runs} ===")
         print("Command:", " ".join(cmd))
 
-        rc = subprocess.call(cmd)
+        log_state = _crash_log_state(crash_log)
+        try:
+            rc = subprocess.call(cmd)
+        finally:
+            if argfile is not None:
+                try:
+                    os.remove(argfile)
+                except OSError:
+                    pass
         last_rc = rc
+        if rc == 0 and _crash_log_state(crash_log) == log_state:
+            # Clean run and nothing was appended to the log: no need to reparse it.
+            break
 
-        crashed = _unique_keep_order(_read_crashed_nodeids_jsonl(crash_log))
-        if crashed:
-            deselect_nodeids = crashed
+        crashed = _read_crashed_nodeids_jsonl(crash_log)
+        new_crashed = [nid for nid in crashed if nid not in deselected]
+        deselected.update(new_crashed)
+        deselect_args.extend(f"--deselect={nid}" for nid in new_crashed)
 
         new_count = len(crashed) - start_count
         print(f"Crash log: total={len(crashed)} (new since start={max(new_count, 0)})")
 
         # If no crashes recorded at all, or no new crashes were added since previous iteration,
         # stop retrying. (We still return the pytest return code.)
-        if run_idx == 1 and not crashed:
+        if not new_crashed:
             _print_final_summary(crash_log=crash_log, start_count=start_count)
             return rc
 
-        if run_idx > 1:
-            prev = set(deselect_nodeids)
-            curr = set(crashed)
-            if curr == prev:
-                _print_final_summary(crash_log=crash_log, start_count=start_count)
-                return rc
-
     _print_final_summary(crash_log=crash_log, start_count=start_count)
     return last_rc
 
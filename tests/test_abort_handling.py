@@ -1,9 +1,25 @@
 from __future__ import annotations
 
+import html
 import json
+import math
 import os
 
-from pytest_abort.abort_handling import append_abort_to_json
+import pytest
+
+from pytest_abort import abort_handling
+from pytest_abort.abort_handling import (
+    _escape_control_chars_in_json_strings,
+    _sanitize_obj_for_html_jsonblob,
+    _sanitize_str_for_html_jsonblob,
+    append_abort_to_json,
+    append_crash_to_jsonl,
+    append_aborts_to_csv,
+    handle_aborts,
+    sanitize_all_html_jsonblobs,
+    sanitize_for_json,
+    sanitize_html_file_jsonblob,
+)
 
 
 def test_append_abort_to_json_creates_report_with_generic_root(tmp_path, monkeypatch):
@@ -29,3 +45,165 @@ def test_append_abort_to_json_creates_report_with_generic_root(tmp_path, monkeyp
     assert data["summary"]["failed"] == 1
     assert data["tests"][0]["nodeid"] == abort_info["nodeid"]
 
+
+def test_control_char_sanitizers_handle_ascii_and_unicode():
+    assert sanitize_for_json("a\x00b\n\r\tc\x7f") == "a b\n\r\tc "
+    assert sanitize_for_json("caf\u00e9\u200bx") == "caf\u00e9 x"
+
+    assert _sanitize_str_for_html_jsonblob("a\r\nb\rc\nd\te\x1b") == "a<br/>b<br/>c<br/>d  e "
+    assert _sanitize_str_for_html_jsonblob("\u00e9\ufeff") == "\u00e9 "
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_sanitize_html_file_jsonblob_rewrites_only_when_needed(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(abort_handling, "orjson", None)
+    elif abort_handling.orjson is None:
+        pytest.skip("orjson not installed")
+
+    def write_report(path, blob):
+        attr = html.escape(json.dumps(blob), quote=True)
+        path.write_text(f'<div id="data-container" data-jsonblob="{attr}"></div>', encoding="utf-8")
+
+    dirty = tmp_path / "dirty_log.html"
+    write_report(dirty, {"tests": {"test_0": {"log": "line1\nline2\tx", "result": "failed"}}})
+    assert sanitize_html_file_jsonblob(str(dirty)) is True
+    text = dirty.read_text(encoding="utf-8")
+    blob = json.loads(html.unescape(text.split('data-jsonblob="', 1)[1].split('"', 1)[0]))
+    assert blob["tests"]["test_0"]["log"] == "line1<br/>line2  x"
+    assert sanitize_html_file_jsonblob(str(dirty)) is False
+
+    clean = tmp_path / "clean_log.html"
+    write_report(clean, {"tests": {"test_0": {"log": "ok\\n", "result": "passed"}}})
+    before = clean.read_text(encoding="utf-8")
+    assert sanitize_html_file_jsonblob(str(clean)) is False
+    assert clean.read_text(encoding="utf-8") == before
+
+
+def test_sanitize_html_file_jsonblob_keeps_file_mode(tmp_path):
+    report = tmp_path / "dirty_log.html"
+    attr = html.escape(json.dumps({"tests": {"test_0": {"log": "a\nb"}}}), quote=True)
+    report.write_text(f'<div id="data-container" data-jsonblob="{attr}"></div>', encoding="utf-8")
+    os.chmod(report, 0o640)
+
+    assert sanitize_html_file_jsonblob(str(report)) is True
+    assert os.stat(report).st_mode & 0o777 == 0o640
+
+
+def test_escape_control_chars_only_inside_json_strings():
+    broken = '{\n  "log": "a\tb\nc \\"q\x01\\" \\\\",\n  "ok": "x"\n}'
+    fixed = _escape_control_chars_in_json_strings(broken)
+    assert fixed.startswith("{\n  ")
+    assert json.loads(fixed) == {"log": 'a\tb\nc "q\x01" \\', "ok": "x"}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sanitize_all_html_jsonblobs_counts(tmp_path, max_workers):
+    for i in range(5):
+        blob = {"tests": {"test_0": {"log": f"line{i}\nnext" if i % 2 else "clean"}}}
+        attr = html.escape(json.dumps(blob), quote=True)
+        (tmp_path / f"f{i}_log.html").write_text(f'<div data-jsonblob="{attr}"></div>', encoding="utf-8")
+    (tmp_path / "bad_log.html").write_text('<div data-jsonblob="{&quot;a\n"></div>', encoding="utf-8")
+
+    assert sanitize_all_html_jsonblobs(str(tmp_path), max_workers=max_workers) == (2, 6, 1)
+
+
+def test_handle_aborts_patches_reports_once_for_a_batch(tmp_path, monkeypatch):
+    monkeypatch.delenv(abort_handling.ENV_CRASHED_TESTS_LOG, raising=False)
+    json_file = tmp_path / "demo_log.json"
+    html_file = tmp_path / "demo_log.html"
+    infos = [
+        {"test_name": f"tests/test_demo.py::test_{i}", "nodeid": f"tests/test_demo.py::test_{i}",
+         "reason": "Test crashed", "duration": 1.0}
+        for i in range(3)
+    ]
+
+    assert handle_aborts(str(json_file), str(html_file), "test_demo", infos) is True
+
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    assert data["summary"]["failed"] == 3
+    assert [t["nodeid"] for t in data["tests"]] == [i["nodeid"] for i in infos]
+
+    text = html_file.read_text(encoding="utf-8")
+    assert "3 tests took" in text
+    assert "3 Failed," in text
+    blob = json.loads(html.unescape(text.split('data-jsonblob="', 1)[1].split('"', 1)[0]))
+    assert sorted(blob["tests"]) == ["test_0", "test_1", "test_2"]
+
+
+def test_append_aborts_to_csv_fills_default_and_custom_headers(tmp_path):
+    info = {"nodeid": "tests/test_demo.py::TestX::test_a", "reason": "boom", "duration": 2}
+
+    default_csv = tmp_path / "default.csv"
+    append_aborts_to_csv(str(default_csv), [info, dict(info)])
+    lines = default_csv.read_text(encoding="utf-8").splitlines()
+    assert lines == [
+        "id,module,name,file,doc,markers,status,message,duration",
+        "tests/test_demo.py::TestX::test_a,tests.test_demo,test_a,tests/test_demo.py,,,failed,boom,2.0",
+    ]
+
+    custom_csv = tmp_path / "custom.csv"
+    custom_csv.write_text("nodeid,outcome,extra\n", encoding="utf-8")
+    append_aborts_to_csv(str(custom_csv), [info])
+    lines = custom_csv.read_text(encoding="utf-8").splitlines()
+    assert lines[1] == "tests/test_demo.py::TestX::test_a,failed,"
+
+
+def test_sanitize_obj_for_html_jsonblob_walks_in_place():
+    blob = {"tests": {"t": [{"log": "a\nb", "n": 1, "tags": ["ok", "x\ty"]}]}, "title": "clean"}
+    res, changed = _sanitize_obj_for_html_jsonblob(blob)
+    assert changed is True and res is blob
+    assert blob == {"tests": {"t": [{"log": "a<br/>b", "n": 1, "tags": ["ok", "x  y"]}]}, "title": "clean"}
+    assert _sanitize_obj_for_html_jsonblob(blob) == (blob, False)
+
+
+def test_abort_test_json_entries_do_not_share_nested_dicts():
+    info = {"test_name": "a.py::test_a", "reason": "boom"}
+    first = abort_handling._abort_test_json("a", info)  # pylint: disable=protected-access
+    first["setup"]["outcome"] = "edited"
+    second = abort_handling._abort_test_json("a", info)  # pylint: disable=protected-access
+    assert second["setup"] == {"duration": 0.0, "outcome": "passed"}
+    assert second["teardown"] is not first["teardown"]
+
+
+def test_append_abort_to_json_keeps_non_finite_floats(tmp_path):
+    json_file = tmp_path / "out.json"
+    json_file.write_text(
+        '{"tests": [], "summary": {}, "environment": {"ratio": NaN, "limit": Infinity, "note": null}}',
+        encoding="utf-8",
+    )
+
+    append_abort_to_json(
+        str(json_file), testfile="test_demo", abort_info={"test_name": "test_demo.py::test_a", "reason": "x"}
+    )
+    env = json.loads(json_file.read_text(encoding="utf-8"))["environment"]
+
+    assert math.isnan(env["ratio"])
+    assert env["limit"] == math.inf
+    assert env["note"] is None
+
+
+def test_append_crash_to_jsonl_keeps_non_finite_duration(tmp_path):
+    log = tmp_path / "crashed.jsonl"
+
+    append_crash_to_jsonl(str(log), {"nodeid": "a.py::test_a", "duration": float("nan")}, source="test")
+    rec = json.loads(log.read_text(encoding="utf-8"))
+
+    assert rec["nodeid"] == "a.py::test_a"
+    assert math.isnan(rec["duration"])
+
+
+def test_append_crash_to_jsonl_finishes_short_writes(tmp_path, monkeypatch):
+    log = tmp_path / "crashed.jsonl"
+    real_write = os.write
+
+    def short_write(fd, data):
+        return real_write(fd, bytes(data[:7]))
+
+    monkeypatch.setattr(abort_handling.os, "write", short_write)
+    append_crash_to_jsonl(str(log), {"nodeid": "a.py::test_a"}, source="test")
+    append_crash_to_jsonl(str(log), {"nodeid": "a.py::test_b"}, source="test")
+    monkeypatch.undo()
+
+    lines = log.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["nodeid"] for line in lines] == ["a.py::test_a", "a.py::test_b"]
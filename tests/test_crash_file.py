@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime, timedelta
 
 from pytest_abort.crash_file import check_for_crash_file
@@ -36,3 +37,26 @@ def test_check_for_crash_file_ignores_non_running(tmp_path):
 
     assert check_for_crash_file(str(p), min_duration=0.0) is None
 
+
+def test_check_for_crash_file_missing_or_empty_marker(tmp_path):
+    p = tmp_path / "last_running.json"
+    assert check_for_crash_file(str(p), min_duration=0.0) is None
+
+    p.write_bytes(b"")
+    assert check_for_crash_file(str(p), min_duration=0.0) is None
+    assert p.exists()
+
+
+def test_check_for_crash_file_reads_start_time_ns(tmp_path):
+    p = tmp_path / "last_running.json"
+    payload = {
+        "test_name": "test_foo",
+        "nodeid": "tests/test_demo.py::test_foo",
+        "start_time_ns": time.time_ns() - 5_000_000_000,
+        "status": "running",
+    }
+    p.write_text(json.dumps(payload), encoding="utf-8")
+
+    info = check_for_crash_file(str(p), min_duration=1.0)
+    assert info is not None
+    assert 5.0 <= info["duration"] < 60.0
@@ -2,13 +2,98 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from pytest_abort import plugin
 
 
-def test_atomic_write_json_creates_parent_dir(tmp_path):
+def _marker(nodeid: str) -> bytes:
+    return plugin._format_marker_bytes(  # pylint: disable=protected-access
+        nodeid.rpartition("::")[2], nodeid, 1_700_000_000_000_000_000, 42, "0"
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_atomic_write_bytes_creates_parent_dir(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(plugin, "orjson", None)
+    elif plugin.orjson is None:
+        pytest.skip("orjson not installed")
     p = tmp_path / "nested" / "marker.json"
-    payload = {"a": 1}
 
-    plugin._atomic_write_json(str(p), payload)  # pylint: disable=protected-access
-    assert json.loads(p.read_text(encoding="utf-8")) == payload
+    plugin._atomic_write_bytes(str(p), _marker("tests/test_x.py::test_é"))  # pylint: disable=protected-access
+    assert json.loads(p.read_text(encoding="utf-8"))["nodeid"] == "tests/test_x.py::test_é"
+
+
+def test_atomic_write_bytes_recreates_removed_parent_dir(tmp_path):
+    d = tmp_path / "logs"
+    p = d / "marker.json"
+
+    plugin._atomic_write_bytes(str(p), _marker("a"))  # pylint: disable=protected-access
+    p.unlink()
+    d.rmdir()
+    plugin._atomic_write_bytes(str(p), _marker("b"))  # pylint: disable=protected-access
+    assert json.loads(p.read_text(encoding="utf-8"))["nodeid"] == "b"
+
+
+def test_last_running_marker_is_rewritten_in_place_then_removed(tmp_path):
+    p = tmp_path / "last_running.json"
+    marker = plugin._LastRunningMarker(str(p))  # pylint: disable=protected-access
+
+    marker.write(_marker("a.py::test_long_name"))
+    marker.clear()
+    assert p.read_bytes() == b""
+    marker.write(_marker("b"))
+    assert json.loads(p.read_text(encoding="utf-8"))["nodeid"] == "b"
+
+    p.unlink()
+    marker.write(_marker("c"))
+    assert json.loads(p.read_text(encoding="utf-8"))["nodeid"] == "c"
+
+    marker.close()
+    assert not p.exists()
+
+
+def test_closing_one_marker_leaves_other_sessions_markers(tmp_path):
+    outer = plugin._LastRunningMarker(str(tmp_path / "outer.json"))  # pylint: disable=protected-access
+    inner = plugin._LastRunningMarker(str(tmp_path / "inner.json"))  # pylint: disable=protected-access
+    outer.write(_marker("outer"))
+    inner.write(_marker("inner"))
+
+    inner.close()
+    outer.write(_marker("outer2"))
+
+    assert not (tmp_path / "inner.json").exists()
+    assert json.loads((tmp_path / "outer.json").read_text(encoding="utf-8"))["nodeid"] == "outer2"
+    outer.close()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_format_marker_bytes_is_valid_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(plugin, "orjson", None)
+    elif plugin.orjson is None:
+        pytest.skip("orjson not installed")
+    data = plugin._format_marker_bytes(  # pylint: disable=protected-access
+        'test_é["q"]', 'a.py::test_é["q"]', 1_700_000_000_123_456_789, 42, "0,1"
+    )
+    assert json.loads(data) == {
+        "test_name": 'test_é["q"]',
+        "nodeid": 'a.py::test_é["q"]',
+        "start_time_ns": 1_700_000_000_123_456_789,
+        "status": "running",
+        "pid": 42,
+        "gpu_id": "0,1",
+    }
+
 
+@pytest.mark.parametrize(
+    "nodeid,name",
+    [
+        ("a.py::test_x", "test_x"),
+        ("a.py::TestC::test_x[1-a::b]", "test_x[1-a::b]"),
+        ("a.py", "a.py"),
+    ],
+)
+def test_nodeid_test_name_matches_item_name(nodeid, name):
+    assert plugin._nodeid_test_name(nodeid) == name  # pylint: disable=protected-access
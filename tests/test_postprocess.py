@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 
+from pytest_abort import abort_handling
 from pytest_abort.abort_handling import postprocess_reports_from_crash_log
 
 
@@ -67,3 +68,52 @@ def test_postprocess_adds_unique_crashes_and_is_idempotent(tmp_path):
     # postprocess again does not change the HTML file.
     assert html_text2 == html_text1
 
+    # Without the stamp sidecar the run is not skipped; it must still dedupe.
+    (tmp_path / "crashed_tests.jsonl.postprocess.stamp").unlink()
+    postprocess_reports_from_crash_log(
+        str(crash_log),
+        json_report_file=str(json_report),
+        html_report_file=str(html_report),
+        csv_report_file=str(csv_report),
+    )
+    assert json.loads(json_report.read_text(encoding="utf-8")) == data2
+    assert csv_report.read_text(encoding="utf-8") == csv_text2
+    assert html_report.read_text(encoding="utf-8") == html_text1
+
+
+def test_postprocess_skips_unchanged_inputs_via_stamp(tmp_path, monkeypatch):
+    crash_log = tmp_path / "crashed_tests.jsonl"
+    json_report = tmp_path / "tests-report.json"
+    crash_log.write_text(json.dumps({"nodeid": "tests/test_a.py::test_1"}) + "\n", encoding="utf-8")
+
+    postprocess_reports_from_crash_log(str(crash_log), json_report_file=str(json_report))
+    calls = []
+    real = abort_handling._postprocess_reports  # pylint: disable=protected-access
+    monkeypatch.setattr(abort_handling, "_postprocess_reports", lambda *a: calls.append(a) or real(*a))
+
+    postprocess_reports_from_crash_log(str(crash_log), json_report_file=str(json_report))
+    assert not calls
+
+    with crash_log.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"nodeid": "tests/test_a.py::test_2"}) + "\n")
+    postprocess_reports_from_crash_log(str(crash_log), json_report_file=str(json_report))
+    assert len(calls) == 1
+    assert len(json.loads(json_report.read_text(encoding="utf-8"))["tests"]) == 2
+
+
+def test_postprocess_does_not_stamp_a_failed_patch(tmp_path, capsys):
+    crash_log = tmp_path / "crashed_tests.jsonl"
+    blocker = tmp_path / "reports"
+    blocker.write_text("not a directory", encoding="utf-8")
+    html_report = blocker / "tests-report.html"
+    crash_log.write_text(json.dumps({"nodeid": "tests/test_a.py::test_1"}) + "\n", encoding="utf-8")
+
+    # The report's parent is a file, so the HTML write fails (and is swallowed).
+    postprocess_reports_from_crash_log(str(crash_log), html_report_file=str(html_report))
+    capsys.readouterr()
+    assert not (tmp_path / "crashed_tests.jsonl.postprocess.stamp").exists()
+
+    blocker.unlink()
+    postprocess_reports_from_crash_log(str(crash_log), html_report_file=str(html_report))
+    assert "tests/test_a.py::test_1" in html_report.read_text(encoding="utf-8")
+    assert (tmp_path / "crashed_tests.jsonl.postprocess.stamp").exists()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pytest_abort import report_utils
+from pytest_abort.report_utils import combine_json_reports, convert_compiled_json_to_csv
+
+
+def test_combine_json_reports_then_convert_to_csv(tmp_path):
+    reports = [
+        {"tests": [{"nodeid": "a.py::t1", "outcome": "passed", "call": {"duration": 0.5}, "keywords": ["t1", "a.py"]}]},
+        {"tests": [{"nodeid": "b.py::t2", "outcome": "failed"}], "note": "café"},
+    ]
+    (tmp_path / "w0_log.json").write_text(json.dumps(reports[0], indent=2) + "\n", encoding="utf-8")
+    (tmp_path / "w1_log.json").write_text(json.dumps(reports[1], ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "other.json").write_text("{}", encoding="utf-8")
+
+    out = combine_json_reports(str(tmp_path))
+    combined = json.loads((tmp_path / "final_compiled_report.json").read_text(encoding="utf-8"))
+    assert sorted(combined, key=lambda r: r["tests"][0]["nodeid"]) == reports
+
+    csv_file = tmp_path / "out.csv"
+    assert convert_compiled_json_to_csv(out, str(csv_file)) == 2
+    lines = csv_file.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "name,outcome,duration,keywords"
+    assert sorted(lines[1:]) == ["a.py::t1,passed,0.5,t1;a.py", "b.py::t2,failed,0,"]
+
+
+def test_combine_json_reports_rejects_truncated_input(tmp_path):
+    (tmp_path / "w0_log.json").write_text('{"tests": [', encoding="utf-8")
+    out_file = tmp_path / "combined.json"
+    out_file.write_text("previous", encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        combine_json_reports(str(tmp_path), out_file=str(out_file))
+    assert out_file.read_text(encoding="utf-8") == "previous"
+
+
+def test_generate_final_report_builds_json_csv_alongside_html_merge(tmp_path, monkeypatch, capsys):
+    (tmp_path / "w0_log.json").write_text(json.dumps({"tests": [{"nodeid": "a.py::t"}]}), encoding="utf-8")
+    monkeypatch.setattr(report_utils, "merge_html_reports", lambda *a, **k: (False, "merger missing"))
+
+    report_utils.generate_final_report(str(tmp_path))
+
+    assert (tmp_path / "final_compiled_report.csv").read_text(encoding="utf-8").splitlines()[1] == "a.py::t,,0,"
+    assert "merger missing" in capsys.readouterr().out
+
+
+def test_combine_json_reports_rejects_truncated_input_ending_in_brace(tmp_path):
+    # A dying worker can stop right after a nested object's closing brace.
+    (tmp_path / "w0_log.json").write_text('{"tests": [{"nodeid": "a.py::t"}', encoding="utf-8")
+    (tmp_path / "w1_log.json").write_text('{"tests": [{"nodeid": "b.py::t"}]}', encoding="utf-8")
+    out_file = tmp_path / "combined.json"
+    out_file.write_text("previous", encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        combine_json_reports(str(tmp_path), out_file=str(out_file))
+    assert out_file.read_text(encoding="utf-8") == "previous"
+    assert not list(tmp_path.glob("combined.json.tmp.*"))
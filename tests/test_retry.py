@@ -4,6 +4,9 @@ import json
 import os
 from typing import List
 
+import pytest
+
+from pytest_abort import retry
 from pytest_abort.retry import main as retry_main
 
 
@@ -83,3 +86,88 @@ def test_retry_wrapper_deselects_crashed_then_succeeds(tmp_path, capsys, monkeyp
     assert records[0]["executed"] == [crashed_nodeid]
     assert records[1]["executed"] == [passing_nodeid]
 
+
+def test_read_crashed_nodeids_jsonl_skips_bad_lines(tmp_path):
+    p = tmp_path / "crashed.jsonl"
+    p.write_bytes(
+        b'{"nodeid": "a.py::test_\xc3\xa9"}\n'
+        b"not json\n"
+        b"\n"
+        b"[1]\n"
+        b'{"nodeid": " b.py::test_b "}\n'
+        b'{"nodeid": "a.py::test_\xc3\xa9"}\n'
+        b'{"test_name": "x\\"nodeid\\": \\"y", "nodeid": "c.py::test_c[\\"\\u00e9\\"]"}\n'
+    )
+    assert retry._read_crashed_nodeids_jsonl(p) == [  # pylint: disable=protected-access
+        "a.py::test_é",
+        "b.py::test_b",
+        'c.py::test_c["é"]',
+    ]
+
+
+def test_retry_wrapper_keeps_going_while_new_crashes_appear(tmp_path, monkeypatch):
+    crash_log = tmp_path / "crashed_tests.jsonl"
+    crash_order = ["t.py::test_a", "t.py::test_b"]
+    calls: List[List[str]] = []
+
+    def fake_subprocess_call(cmd):
+        calls.append(list(cmd))
+        if len(calls) <= len(crash_order):
+            with open(crash_log, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"nodeid": crash_order[len(calls) - 1]}) + "\n")
+            return 1
+        return 0
+
+    monkeypatch.setattr("pytest_abort.retry.subprocess.call", fake_subprocess_call)
+
+    rc = retry_main(["--crash-log", str(crash_log), "--clear-crash-log", "--", "pytest", "-q"])
+
+    assert rc == 0
+    assert [[a for a in c if a.startswith("--deselect=")] for c in calls] == [
+        [],
+        ["--deselect=t.py::test_a"],
+        ["--deselect=t.py::test_a", "--deselect=t.py::test_b"],
+    ]
+
+
+def test_retry_wrapper_passes_many_deselects_via_argfile(tmp_path, monkeypatch):
+    if not retry._pytest_supports_argfiles():  # pylint: disable=protected-access
+        pytest.skip("pytest < 8.2 has no @argfile support")
+    monkeypatch.setattr(retry, "_ARGFILE_MIN_DESELECTS", 1)
+    crash_log = tmp_path / "crashed_tests.jsonl"
+    calls: List[List[str]] = []
+    argfile_lines: List[List[str]] = []
+
+    def fake_subprocess_call(cmd):
+        calls.append(list(cmd))
+        if cmd[-1].startswith("@"):
+            with open(cmd[-1][1:], encoding="utf-8") as f:
+                argfile_lines.append(f.read().splitlines())
+        if len(calls) == 1:
+            crash_log.write_text(
+                "".join(json.dumps({"nodeid": f"t.py::test_{i}"}) + "\n" for i in range(3)),
+                encoding="utf-8",
+            )
+            return 1
+        return 0
+
+    monkeypatch.setattr("pytest_abort.retry.subprocess.call", fake_subprocess_call)
+
+    assert retry_main(["--crash-log", str(crash_log), "--", "pytest", "-q"]) == 0
+    assert argfile_lines == [[f"--deselect=t.py::test_{i}" for i in range(3)]]
+    # The argfile is removed once the run that used it exits.
+    assert not os.path.exists(calls[1][-1][1:])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["crashed_tests.jsonl"]
+
+
+def test_read_crashed_nodeids_jsonl_torn_line_does_not_swallow_next(tmp_path):
+    p = tmp_path / "crashed.jsonl"
+    p.write_bytes(
+        b'{"nodeid": "t.py::a", "source": "runner"}\n'
+        b'{"nodeid": "t.py::tor\n'
+        b'{"nodeid": "t.py::b", "source": "runner"}\n'
+    )
+    assert retry._read_crashed_nodeids_jsonl(p) == [  # pylint: disable=protected-access
+        "t.py::a",
+        "t.py::b",
+    ]